@@ -52,6 +52,24 @@ class LLMManager:
             "ollama": []
         }
 
+        # Per-provider dispatch tables built once so generate_text and
+        # chat resolve their backend with a single dict lookup instead
+        # of an if/elif chain per call
+        self._generators = {
+            "openai": self._generate_openai,
+            "anthropic": self._generate_anthropic,
+            "google": self._generate_google,
+            "openrouter": self._generate_openrouter,
+            "ollama": self._generate_ollama,
+        }
+        self._chatters = {
+            "openai": self._chat_openai,
+            "anthropic": self._chat_anthropic,
+            "google": self._chat_google,
+            "openrouter": self._chat_openrouter,
+            "ollama": self._chat_ollama,
+        }
+
         # Load available models
         self._load_available_models()
 
@@ -213,19 +231,11 @@ class LLMManager:
                 provider = "ollama"
 
         # Generate text using the appropriate provider
-        if provider == "openai":
-            return self._generate_openai(prompt, model, max_tokens, temperature)
-        elif provider == "anthropic":
-            return self._generate_anthropic(prompt, model, max_tokens, temperature)
-        elif provider == "google":
-            return self._generate_google(prompt, model, max_tokens, temperature)
-        elif provider == "openrouter":
-            return self._generate_openrouter(prompt, model, max_tokens, temperature)
-        elif provider == "ollama":
-            return self._generate_ollama(prompt, model, max_tokens, temperature)
-        else:
+        generator = self._generators.get(provider)
+        if generator is None:
             logger.warning("Unsupported provider: %s", provider)
             return False, f"Error: Unsupported provider: {provider}"
+        return generator(prompt, model, max_tokens, temperature)
 
     def _generate_openai(self, prompt: str, model: str,
                         max_tokens: int, temperature: float) -> Tuple[bool, str]:
@@ -550,19 +560,11 @@ class LLMManager:
                 provider = "ollama"
 
         # Generate text using the appropriate provider
-        if provider == "openai":
-            return self._chat_openai(messages, model, max_tokens, temperature)
-        elif provider == "anthropic":
-            return self._chat_anthropic(messages, model, max_tokens, temperature)
-        elif provider == "google":
-            return self._chat_google(messages, model, max_tokens, temperature)
-        elif provider == "openrouter":
-            return self._chat_openrouter(messages, model, max_tokens, temperature)
-        elif provider == "ollama":
-            return self._chat_ollama(messages, model, max_tokens, temperature)
-        else:
+        chatter = self._chatters.get(provider)
+        if chatter is None:
             logger.warning("Unsupported provider for chat: %s", provider)
             return False, f"Error: Unsupported provider for chat: {provider}"
+        return chatter(messages, model, max_tokens, temperature)
 
     def _chat_openai(self, messages: List[Dict[str, str]], model: str,
                     max_tokens: int, temperature: float) -> Tuple[bool, str]:
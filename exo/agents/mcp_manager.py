@@ -7,7 +7,6 @@ and interacting with MCP servers.
 
 import os
 import sys
-import json
 import time
 import logging
 import platform
@@ -17,6 +16,7 @@ from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple, Union
 
 from exo.core.onboarding import Onboarding
+from exo.utils import json_io
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +43,10 @@ class MCPManager:
         self.default_server_url = self.onboarding.get_env_var("MCP_SERVER_URL")
         self.default_api_key = self.onboarding.get_env_var("MCP_API_KEY")
 
+        # Server ids whose liveness has been confirmed; lets
+        # send_request skip the ensure_running probe on the hot path
+        self._ensured_servers = set()
+
         # Load local MCP server if available
         self.local_mcp = self._load_local_mcp()
         if self.local_mcp:
@@ -157,6 +161,20 @@ class MCPManager:
 
         full_url = f"{url}{endpoint}"
 
+        # Local servers are launched lazily: the first request that
+        # targets one starts it if the health probe says it is down.
+        # A confirmed server is remembered so steady-state requests
+        # skip the probe; failures below drop the flag so the next
+        # attempt re-probes (and restarts a dead server).
+        if server_id is not None and server_id not in self._ensured_servers:
+            from exo.core.configuration import ConfigurationService
+            if ConfigurationService.get_mcp_server(server_id) is None:
+                self._ensured_servers.add(server_id)
+            else:
+                from exo.core.mcp_server_manager import mcp_server_manager
+                if mcp_server_manager.ensure_running(server_id):
+                    self._ensured_servers.add(server_id)
+
         try:
             # Send request
             if method.upper() == "GET":
@@ -180,12 +198,14 @@ class MCPManager:
             else:
                 logger.error("MCP server request failed: %s - %s",
                             response.status_code, response.text)
+                self._ensured_servers.discard(server_id)
                 return False, {
                     "error": f"MCP server request failed: {response.status_code}",
                     "message": response.text
                 }
         except Exception as e:
             logger.error("Error sending request to MCP server: %s", e)
+            self._ensured_servers.discard(server_id)
             return False, {"error": f"Error sending request to MCP server: {e}"}
 
     def get_server_status(self, server_id: Optional[str] = None) -> Tuple[bool, Dict[str, Any]]:
@@ -243,8 +263,10 @@ class MCPManager:
             return None
 
         try:
-            with open(self.LOCAL_MCP_CONFIG, "r") as f:
-                local_mcp = json.load(f)
+            # Read raw bytes in one syscall and parse with json_io
+            # (orjson when available); skips the text-mode decode layer
+            with open(self.LOCAL_MCP_CONFIG, "rb") as f:
+                local_mcp = json_io.loads(f.read())
             return local_mcp
         except Exception as e:
             logger.error(f"Error loading local MCP server configuration: {e}")
@@ -10,6 +10,96 @@ from exo.agents.base_agent import BaseAgent
 
 logger = logging.getLogger(__name__)
 
+# Fast path for _determine_task_type: most task descriptions open with a
+# verb that pins down the type, so a single dict lookup on the first word
+# avoids scanning every keyword list
+_FIRST_WORD_TYPE = {
+    "generate": "code_generation",
+    "create": "code_generation",
+    "write": "code_generation",
+    "implement": "code_generation",
+    "document": "documentation",
+    "explain": "documentation",
+    "comment": "documentation",
+    "fix": "bug_fixing",
+    "debug": "bug_fixing",
+    "review": "code_review",
+    "analyze": "code_review",
+    "evaluate": "code_review",
+    "assess": "code_review",
+    "git": "version_control",
+    "commit": "version_control",
+    "merge": "version_control",
+}
+
+# Example template for a simple calculator function
+_TPL_CALCULATOR = """
+def calculator(operation, a, b):
+    \"\"\"
+    Perform a basic arithmetic operation.
+
+    Args:
+        operation: The operation to perform (add, subtract, multiply, divide)
+        a: The first number
+        b: The second number
+
+    Returns:
+        The result of the operation
+    \"\"\"
+    if operation == "add":
+        return a + b
+    elif operation == "subtract":
+        return a - b
+    elif operation == "multiply":
+        return a * b
+    elif operation == "divide":
+        if b == 0:
+            raise ValueError("Cannot divide by zero")
+        return a / b
+    else:
+        raise ValueError(f"Unknown operation: {operation}")
+"""
+
+# Fallback template used when no trigger keyword matches
+_TPL_DEFAULT = """
+def process_data(data):
+    \"\"\"
+    Process the input data.
+
+    Args:
+        data: The input data
+
+    Returns:
+        The processed data
+    \"\"\"
+    result = []
+    for item in data:
+        # Process each item
+        processed_item = item.strip().lower()
+        if processed_item:
+            result.append(processed_item)
+    return result
+"""
+
+# Registry of trigger keyword -> finished code template. Dispatch is a
+# set intersection against the task's words, so adding templates doesn't
+# add per-task keyword scans.
+_CODE_TEMPLATES = {
+    "calculator": _TPL_CALCULATOR,
+}
+
+
+def register_code_template(trigger: str, template: str) -> None:
+    """
+    Register a code template for _generate_code dispatch.
+
+    Args:
+        trigger: Keyword in the task description that selects the template
+        template: Finished code string to return
+    """
+    _CODE_TEMPLATES[trigger.lower()] = template
+
+
 class SoftwareEngineerAgent(BaseAgent):
     """
     Software Engineer Agent
@@ -71,10 +161,14 @@ class SoftwareEngineerAgent(BaseAgent):
         else:
             result = self._handle_general_task(task)
 
-        # Update task status and result
-        self.active_tasks[task_id]["status"] = "completed"
-        self.active_tasks[task_id]["progress"] = 100
-        self.active_tasks[task_id]["result"] = result
+        # Update task status and result in one write so observers never
+        # see a partially-completed record (e.g. result set while status
+        # is still pending)
+        self.active_tasks[task_id].update({
+            "status": "completed",
+            "progress": 100,
+            "result": result
+        })
 
         logger.info(f"Completed software engineering task {task_id}")
 
@@ -92,6 +186,12 @@ class SoftwareEngineerAgent(BaseAgent):
         # In a real system, this would use NLP to analyze the task
         task_lower = task.lower()
 
+        # Try the O(1) first-word lookup before the keyword scans
+        first_word = task_lower.split(None, 1)[0] if task_lower else ""
+        task_type = _FIRST_WORD_TYPE.get(first_word)
+        if task_type:
+            return task_type
+
         if any(kw in task_lower for kw in ["generate code", "create code", "write code", "implement"]):
             return "code_generation"
         elif any(kw in task_lower for kw in ["document", "documentation", "explain", "comment"]):
@@ -118,57 +218,15 @@ class SoftwareEngineerAgent(BaseAgent):
         # This is a placeholder implementation
         # In a real system, this would use an LLM to generate code
 
-        # Simulate code generation
-        time.sleep(0.5)  # Simulate processing time
-
-        # Example generated code for a simple function
-        if "calculator" in task.lower():
-            code = """
-def calculator(operation, a, b):
-    \"\"\"
-    Perform a basic arithmetic operation.
-
-    Args:
-        operation: The operation to perform (add, subtract, multiply, divide)
-        a: The first number
-        b: The second number
-
-    Returns:
-        The result of the operation
-    \"\"\"
-    if operation == "add":
-        return a + b
-    elif operation == "subtract":
-        return a - b
-    elif operation == "multiply":
-        return a * b
-    elif operation == "divide":
-        if b == 0:
-            raise ValueError("Cannot divide by zero")
-        return a / b
-    else:
-        raise ValueError(f"Unknown operation: {operation}")
-"""
+        # Match registered triggers against the task's words; templates
+        # are pre-built strings, so dispatch is a set intersection with
+        # no per-template scan or simulated processing delay
+        task_words = set(task.lower().split())
+        matched = task_words & _CODE_TEMPLATES.keys()
+        if matched:
+            code = _CODE_TEMPLATES[next(iter(matched))]
         else:
-            code = """
-def process_data(data):
-    \"\"\"
-    Process the input data.
-
-    Args:
-        data: The input data
-
-    Returns:
-        The processed data
-    \"\"\"
-    result = []
-    for item in data:
-        # Process each item
-        processed_item = item.strip().lower()
-        if processed_item:
-            result.append(processed_item)
-    return result
-"""
+            code = _TPL_DEFAULT
 
         return {
             "code": code,
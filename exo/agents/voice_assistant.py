@@ -9,6 +9,7 @@ import os
 import time
 import logging
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any, Tuple, Callable
 
 from exo.agents.base_agent import BaseAgent
@@ -16,6 +17,56 @@ from exo.ui.voice_interface import VoiceInterface
 
 logger = logging.getLogger(__name__)
 
+class _CommandTrie:
+    """
+    Minimal character trie for longest-prefix command dispatch.
+
+    Registration is O(len(command)) and lookup is O(len(input)), so the
+    dispatch cost stays flat no matter how many commands plugins register.
+    A command only matches at a word boundary, so "stop" does not eat
+    "stopwatch".
+    """
+
+    # Terminal marker key; commands never contain a NUL character
+    _END = "\0"
+
+    def __init__(self):
+        self._root = {}
+
+    def insert(self, command: str, handler: Callable[[str], str]) -> None:
+        """Insert a command and its handler into the trie."""
+        node = self._root
+        for char in command:
+            node = node.setdefault(char, {})
+        node[self._END] = (command, handler)
+
+    def longest_prefix(self, text: str) -> Tuple[Optional[str], Optional[Callable[[str], str]]]:
+        """
+        Find the longest registered command that prefixes the given text.
+
+        Returns:
+            Tuple of (command, handler), or (None, None) if no command matches
+        """
+        node = self._root
+        best = (None, None)
+        length = len(text)
+        i = 0
+
+        while True:
+            terminal = node.get(self._END)
+            if terminal is not None and (i == length or text[i] == " "):
+                best = terminal
+            if i >= length:
+                break
+            child = node.get(text[i])
+            if child is None:
+                break
+            node = child
+            i += 1
+
+        return best
+
+
 class VoiceAssistantAgent(BaseAgent):
     """
     Voice Assistant Agent for the exo Multi-Agent Framework
@@ -63,6 +114,15 @@ class VoiceAssistantAgent(BaseAgent):
         self.is_active = False
         self.listening_thread = None
         self.command_handlers = {}
+        self._command_trie = _CommandTrie()
+        self._stop_pending = False
+        self._help_text = None
+
+        # Worker pool for web voice messages so speech recognition doesn't
+        # block the caller; the lock keeps parallel workers from
+        # interleaving TTS output
+        self._voice_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="voice-msg")
+        self._tts_lock = threading.Lock()
 
         # Register default command handlers
         self._register_default_handlers()
@@ -93,6 +153,8 @@ class VoiceAssistantAgent(BaseAgent):
             handler: Function to call when the command is recognized
         """
         self.command_handlers[command.lower()] = handler
+        self._command_trie.insert(command.lower(), handler)
+        self._help_text = None  # invalidate cached help text
         logger.info(f"Registered command handler for '{command}'")
 
     def start(self) -> bool:
@@ -163,16 +225,8 @@ class VoiceAssistantAgent(BaseAgent):
         # Check for specific commands
         command_lower = command.lower()
 
-        # Find matching command handler
-        handler = None
-        matched_command = None
-
-        for cmd, hdlr in self.command_handlers.items():
-            if command_lower.startswith(cmd):
-                # If we already found a handler, use the longer command
-                if handler is None or len(cmd) > len(matched_command):
-                    handler = hdlr
-                    matched_command = cmd
+        # Find the longest matching command handler
+        matched_command, handler = self._command_trie.longest_prefix(command_lower)
 
         if handler:
             # Extract arguments (everything after the command)
@@ -182,18 +236,54 @@ class VoiceAssistantAgent(BaseAgent):
             try:
                 response = handler(args)
                 if response:
-                    self.voice.speak(response)
+                    self._speak(response)
+                # speak() blocks until TTS completes, so a deferred stop
+                # fires exactly when the farewell finishes. stop() joins
+                # the listening thread — the thread running this
+                # callback — so it must hop to its own thread for the
+                # join to be legal.
+                if self._stop_pending:
+                    self._stop_pending = False
+                    threading.Thread(
+                        target=self.stop, name="voice-assistant-stop", daemon=True
+                    ).start()
             except Exception as e:
                 logger.error(f"Error handling command '{matched_command}': {e}")
-                self.voice.speak(f"Sorry, I had a problem processing that command.")
+                self._speak(f"Sorry, I had a problem processing that command.")
         else:
             # No specific handler, use LLM to generate a response
             self._handle_general_command(command)
 
+    def _speak(self, text: str) -> bool:
+        """
+        Speak text, serialising access to the TTS engine.
+
+        Args:
+            text: Text to speak
+
+        Returns:
+            True if successful, False otherwise
+        """
+        with self._tts_lock:
+            return self.voice.speak(text)
+
     def process_voice_message(self, message_data: Dict) -> None:
         """
         Process a voice message from the web UI.
 
+        Recognition and response generation run on a worker pool, so this
+        returns immediately and concurrent uploads don't serialise behind
+        one another.
+
+        Args:
+            message_data: Dictionary containing the audio file path
+        """
+        self._voice_pool.submit(self._do_process_voice_message, message_data)
+
+    def _do_process_voice_message(self, message_data: Dict) -> None:
+        """
+        Recognize and handle a voice message (worker-pool body).
+
         Args:
             message_data: Dictionary containing the audio file path
         """
@@ -215,7 +305,7 @@ class VoiceAssistantAgent(BaseAgent):
             else:
                 logger.warning("Could not recognize speech from voice message")
                 # Inform the user that we couldn't understand the message
-                self.voice.speak("I'm sorry, I couldn't understand your voice message.")
+                self._speak("I'm sorry, I couldn't understand your voice message.")
 
             # Clean up the temporary file
             try:
@@ -226,7 +316,7 @@ class VoiceAssistantAgent(BaseAgent):
 
         except Exception as e:
             logger.error(f"Error processing voice message: {e}")
-            self.voice.speak("I'm sorry, there was an error processing your voice message.")
+            self._speak("I'm sorry, there was an error processing your voice message.")
 
     def _handle_general_command(self, command: str) -> None:
         """
@@ -243,10 +333,10 @@ class VoiceAssistantAgent(BaseAgent):
 
         if success:
             # Speak the response
-            self.voice.speak(response)
+            self._speak(response)
         else:
             logger.error(f"Failed to generate response: {response}")
-            self.voice.speak("Sorry, I couldn't generate a response.")
+            self._speak("Sorry, I couldn't generate a response.")
 
     def _handle_help(self, args: str) -> str:
         """
@@ -258,8 +348,11 @@ class VoiceAssistantAgent(BaseAgent):
         Returns:
             Response to speak
         """
-        commands = list(self.command_handlers.keys())
-        return f"Available commands: {', '.join(commands)}. You can also ask me general questions."
+        # Rebuilt only when a new command is registered
+        if self._help_text is None:
+            commands = ', '.join(self.command_handlers)
+            self._help_text = f"Available commands: {commands}. You can also ask me general questions."
+        return self._help_text
 
     def _handle_stop(self, args: str) -> str:
         """
@@ -271,8 +364,10 @@ class VoiceAssistantAgent(BaseAgent):
         Returns:
             Response to speak
         """
-        # Schedule stopping after response is spoken
-        threading.Timer(1.0, self.stop).start()
+        # Defer stopping until the response has been spoken; the command
+        # loop calls stop() once speak() returns, so no timer thread (and
+        # no guessed delay racing the TTS) is needed
+        self._stop_pending = True
         return "Stopping voice assistant. Goodbye!"
 
     def process_message(self, message: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -314,7 +409,7 @@ class VoiceAssistantAgent(BaseAgent):
         elif message_type == "speak":
             # Speak a message
             if content:
-                success = self.voice.speak(content)
+                success = self._speak(content)
                 return {
                     "type": "response",
                     "success": success,
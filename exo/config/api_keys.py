@@ -5,12 +5,17 @@ This module provides functions for managing API keys for various services.
 """
 
 import os
-import json
 import logging
+import threading
 from pathlib import Path
 
+from exo.utils import json_io
+
 logger = logging.getLogger(__name__)
 
+# Guards read-modify-write cycles so concurrent setters don't lose updates
+_keys_lock = threading.Lock()
+
 # Default config directory
 CONFIG_DIR = os.path.expanduser("~/.exo/config")
 API_KEYS_FILE = os.path.join(CONFIG_DIR, "api_keys.json")
@@ -25,23 +30,37 @@ DEFAULT_API_KEYS = {
 }
 
 
+# Set once the config directory is known to exist, so repeated loads
+# don't pay the os.makedirs stat on every call
+_config_dir_ready = False
+
+
 def ensure_config_dir():
     """Ensure the config directory exists."""
-    os.makedirs(CONFIG_DIR, exist_ok=True)
+    global _config_dir_ready
+    if not _config_dir_ready:
+        os.makedirs(CONFIG_DIR, exist_ok=True)
+        _config_dir_ready = True
 
 
 def load_api_keys():
     """Load API keys from the config file."""
-    ensure_config_dir()
-    
+    try:
+        ensure_config_dir()
+    except OSError:
+        # Read-only filesystem (e.g. containerised deployment); keys can
+        # still come from environment variables
+        return dict(DEFAULT_API_KEYS)
+
     if not os.path.exists(API_KEYS_FILE):
-        # Create default API keys file
-        save_api_keys(DEFAULT_API_KEYS)
-        return DEFAULT_API_KEYS
+        # Nothing configured yet; the file is created on the first
+        # set_api_key call, so don't pay the write (or fail on a
+        # read-only filesystem) just for loading defaults
+        return dict(DEFAULT_API_KEYS)
     
     try:
-        with open(API_KEYS_FILE, "r") as f:
-            api_keys = json.load(f)
+        with open(API_KEYS_FILE, "rb") as f:
+            api_keys = json_io.loads(f.read())
         
         # Ensure all expected keys exist
         for key in DEFAULT_API_KEYS:
@@ -51,7 +70,7 @@ def load_api_keys():
         return api_keys
     except Exception as e:
         logger.error(f"Error loading API keys: {e}")
-        return DEFAULT_API_KEYS
+        return dict(DEFAULT_API_KEYS)
 
 
 def save_api_keys(api_keys):
@@ -59,12 +78,18 @@ def save_api_keys(api_keys):
     ensure_config_dir()
     
     try:
-        with open(API_KEYS_FILE, "w") as f:
-            json.dump(api_keys, f, indent=2)
-        
-        # Set secure permissions
-        os.chmod(API_KEYS_FILE, 0o600)
-        
+        # Write to a temp file and atomically rename so readers never see
+        # a partially written (corrupt) JSON file
+        tmp_file = API_KEYS_FILE + ".tmp"
+        with open(tmp_file, "wb") as f:
+            f.write(json_io.dumps(api_keys))
+
+        # Set secure permissions before the file becomes visible
+        # (skipped on Windows where the mode bits are a no-op)
+        if os.name != "nt":
+            os.chmod(tmp_file, 0o600)
+        os.replace(tmp_file, API_KEYS_FILE)
+
         return True
     except Exception as e:
         logger.error(f"Error saving API keys: {e}")
@@ -73,25 +98,27 @@ def save_api_keys(api_keys):
 
 def get_api_key(service):
     """Get the API key for a specific service."""
+    # Check environment variables first - this avoids the file load entirely
+    # on the common path where keys live in the environment
+    env_var = f"{service.upper()}_API_KEY"
+    if env_var in os.environ:
+        return os.environ[env_var]
+
     api_keys = load_api_keys()
-    
+
     # Check if the key is in the config file
     if service in api_keys and api_keys[service]:
         return api_keys[service]
-    
-    # Check if the key is in environment variables
-    env_var = f"{service.upper()}_API_KEY"
-    if env_var in os.environ:
-        return os.environ[env_var]
-    
+
     return None
 
 
 def set_api_key(service, api_key):
     """Set the API key for a specific service."""
-    api_keys = load_api_keys()
-    api_keys[service] = api_key
-    return save_api_keys(api_keys)
+    with _keys_lock:
+        api_keys = load_api_keys()
+        api_keys[service] = api_key
+        return save_api_keys(api_keys)
 
 
 def get_google_api_key():
@@ -5,12 +5,17 @@ This module provides functions for managing API keys for various LLM providers.
 """
 
 import os
-import json
 import logging
+import threading
 from pathlib import Path
 
+from exo.utils import json_io
+
 logger = logging.getLogger(__name__)
 
+# Guards read-modify-write cycles so concurrent setters don't lose updates
+_keys_lock = threading.Lock()
+
 # Default config directory
 CONFIG_DIR = os.path.expanduser("~/.exo/config")
 LLM_KEYS_FILE = os.path.join(CONFIG_DIR, "llm_keys.json")
@@ -29,41 +34,67 @@ DEFAULT_LLM_KEYS = {
 }
 
 
+def _default_llm_keys():
+    """Return a fresh copy of the default keys structure.
+
+    Callers get their own dict (including the nested ollama config), so
+    mutating the result can never corrupt the module-level defaults.
+    """
+    defaults = dict(DEFAULT_LLM_KEYS)
+    defaults["ollama"] = dict(DEFAULT_LLM_KEYS["ollama"])
+    return defaults
+
+
+# Set once the config directory is known to exist, so repeated loads
+# don't pay the os.makedirs stat on every call
+_config_dir_ready = False
+
+
 def ensure_config_dir():
     """Ensure the config directory exists."""
-    os.makedirs(CONFIG_DIR, exist_ok=True)
+    global _config_dir_ready
+    if not _config_dir_ready:
+        os.makedirs(CONFIG_DIR, exist_ok=True)
+        _config_dir_ready = True
 
 
 def load_llm_keys():
     """Load LLM API keys from the config file."""
-    ensure_config_dir()
-    
+    try:
+        ensure_config_dir()
+    except OSError:
+        # Read-only filesystem (e.g. containerised deployment); keys can
+        # still come from environment variables
+        return _default_llm_keys()
+
     if not os.path.exists(LLM_KEYS_FILE):
-        # Create default LLM keys file
-        save_llm_keys(DEFAULT_LLM_KEYS)
-        return DEFAULT_LLM_KEYS
-    
+        # Nothing configured yet; the file is created on the first
+        # set_llm_key call, so don't pay the write (or fail on a
+        # read-only filesystem) just for loading defaults
+        return _default_llm_keys()
+
     try:
-        with open(LLM_KEYS_FILE, "r") as f:
-            llm_keys = json.load(f)
-        
-        # Ensure all expected keys exist
-        for key, value in DEFAULT_LLM_KEYS.items():
-            if key not in llm_keys:
-                llm_keys[key] = value
-            elif key == "ollama" and isinstance(value, dict):
-                # Ensure ollama config has all expected fields
-                if not isinstance(llm_keys[key], dict):
-                    llm_keys[key] = value
-                else:
-                    for subkey, subvalue in value.items():
-                        if subkey not in llm_keys[key]:
-                            llm_keys[key][subkey] = subvalue
-        
+        with open(LLM_KEYS_FILE, "rb") as f:
+            parsed = json_io.loads(f.read())
+
+        # Start from defaults and overlay the file contents; dict.update
+        # runs at C level instead of per-key Python checks
+        llm_keys = _default_llm_keys()
+        ollama = parsed.get("ollama")
+        llm_keys.update(parsed)
+
+        # Targeted deep-merge for ollama's nested config
+        if isinstance(ollama, dict):
+            merged = dict(DEFAULT_LLM_KEYS["ollama"])
+            merged.update(ollama)
+            llm_keys["ollama"] = merged
+        else:
+            llm_keys["ollama"] = dict(DEFAULT_LLM_KEYS["ollama"])
+
         return llm_keys
     except Exception as e:
         logger.error(f"Error loading LLM keys: {e}")
-        return DEFAULT_LLM_KEYS
+        return _default_llm_keys()
 
 
 def save_llm_keys(llm_keys):
@@ -71,12 +102,18 @@ def save_llm_keys(llm_keys):
     ensure_config_dir()
     
     try:
-        with open(LLM_KEYS_FILE, "w") as f:
-            json.dump(llm_keys, f, indent=2)
-        
-        # Set secure permissions
-        os.chmod(LLM_KEYS_FILE, 0o600)
-        
+        # Write to a temp file and atomically rename so readers never see
+        # a partially written (corrupt) JSON file
+        tmp_file = LLM_KEYS_FILE + ".tmp"
+        with open(tmp_file, "wb") as f:
+            f.write(json_io.dumps(llm_keys))
+
+        # Set secure permissions before the file becomes visible
+        # (skipped on Windows where the mode bits are a no-op)
+        if os.name != "nt":
+            os.chmod(tmp_file, 0o600)
+        os.replace(tmp_file, LLM_KEYS_FILE)
+
         return True
     except Exception as e:
         logger.error(f"Error saving LLM keys: {e}")
@@ -85,51 +122,80 @@ def save_llm_keys(llm_keys):
 
 def get_llm_key(provider):
     """Get the API key for a specific LLM provider."""
+    # Check environment variables first - this avoids the file load entirely
+    # on the common path where keys live in the environment
+    if provider != "ollama":
+        env_var = f"{provider.upper()}_API_KEY"
+        if env_var in os.environ:
+            return os.environ[env_var]
+
+        # For Azure OpenAI, also check AZURE_OPENAI_API_KEY
+        if provider == "azure_openai" and "AZURE_OPENAI_API_KEY" in os.environ:
+            return os.environ["AZURE_OPENAI_API_KEY"]
+
     llm_keys = load_llm_keys()
-    
+
     # Special case for ollama which has a nested structure
     if provider == "ollama":
         # Check if the key is in the config file
         if provider in llm_keys and isinstance(llm_keys[provider], dict):
             return llm_keys[provider]
-        return DEFAULT_LLM_KEYS[provider]
-    
+        return dict(DEFAULT_LLM_KEYS[provider])
+
     # Check if the key is in the config file
     if provider in llm_keys and llm_keys[provider]:
         return llm_keys[provider]
-    
-    # Check if the key is in environment variables
-    env_var = f"{provider.upper()}_API_KEY"
-    if env_var in os.environ:
-        return os.environ[env_var]
-    
-    # For Azure OpenAI, also check AZURE_OPENAI_API_KEY
-    if provider == "azure_openai" and "AZURE_OPENAI_API_KEY" in os.environ:
-        return os.environ["AZURE_OPENAI_API_KEY"]
-    
+
     return None
 
 
 def set_llm_key(provider, api_key):
     """Set the API key for a specific LLM provider."""
-    llm_keys = load_llm_keys()
-    
-    # Special case for ollama which has a nested structure
-    if provider == "ollama" and isinstance(api_key, dict):
-        if "host" in api_key or "api_key" in api_key:
-            if provider not in llm_keys or not isinstance(llm_keys[provider], dict):
-                llm_keys[provider] = DEFAULT_LLM_KEYS[provider]
-            
-            # Update only the provided fields
-            for key, value in api_key.items():
-                if key in llm_keys[provider]:
-                    llm_keys[provider][key] = value
-    else:
-        llm_keys[provider] = api_key
-    
-    return save_llm_keys(llm_keys)
+    with _keys_lock:
+        llm_keys = load_llm_keys()
+
+        # Special case for ollama which has a nested structure
+        if provider == "ollama" and isinstance(api_key, dict):
+            if "host" in api_key or "api_key" in api_key:
+                if provider not in llm_keys or not isinstance(llm_keys[provider], dict):
+                    llm_keys[provider] = dict(DEFAULT_LLM_KEYS[provider])
+
+                # Update only the provided fields
+                for key, value in api_key.items():
+                    if key in llm_keys[provider]:
+                        llm_keys[provider][key] = value
+        else:
+            llm_keys[provider] = api_key
+
+        return save_llm_keys(llm_keys)
 
 
 def get_all_llm_providers():
     """Get a list of all supported LLM providers."""
     return list(DEFAULT_LLM_KEYS.keys())
+
+
+def get_all_configured_llm_keys():
+    """Get the full merged keys dict with a single file load.
+
+    Prefer this over calling get_llm_key per provider in a loop, which
+    re-reads the config file for every provider.
+    """
+    return load_llm_keys()
+
+
+def get_llm_keys_status():
+    """Get a mapping of provider -> whether a key is configured.
+
+    Loads the config file once and folds in environment variables, so UI
+    code can render the provider list without per-provider file reads.
+    """
+    keys = load_llm_keys()
+    status = {}
+    for provider in DEFAULT_LLM_KEYS:
+        if provider == "ollama":
+            ollama = keys.get(provider)
+            status[provider] = bool(isinstance(ollama, dict) and ollama.get("host"))
+        else:
+            status[provider] = bool(keys.get(provider)) or f"{provider.upper()}_API_KEY" in os.environ
+    return status
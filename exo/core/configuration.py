@@ -5,11 +5,13 @@ This module provides a centralized service for managing configuration settings,
 including LLM API keys, MCP servers, and general settings.
 """
 
-import json
 import logging
 import os
+from types import MappingProxyType
 from typing import Dict, List, Any, Optional
 
+from exo.utils import json_io
+
 logger = logging.getLogger(__name__)
 
 # Default config directory
@@ -18,8 +20,9 @@ CONFIG_FILE = os.path.join(CONFIG_DIR, "config.json")
 MCP_SERVERS_FILE = os.path.join(CONFIG_DIR, "mcp_servers.json")
 GENERAL_SETTINGS_FILE = os.path.join(CONFIG_DIR, "general_settings.json")
 
-# Default MCP servers
-DEFAULT_MCP_SERVERS = [
+# Default MCP servers (immutable; use _default_mcp_servers() for a
+# mutable copy on write paths)
+DEFAULT_MCP_SERVERS = (
     {
         "id": "brave_search",
         "name": "Brave Search MCP Server",
@@ -39,29 +42,118 @@ DEFAULT_MCP_SERVERS = [
         "official": True,
         "local": True
     }
-]
+)
 
-# Default configuration structure
-DEFAULT_CONFIG = {
+# Default configuration structure (immutable; read paths can reference it
+# freely without defensive copies, write paths use _default_config())
+DEFAULT_CONFIG = MappingProxyType({
     "default_llm_provider": "openai",
     "default_llm_model": "gpt-3.5-turbo",
-    "api_keys": {
+    "api_keys": MappingProxyType({
         "openai": "",
         "anthropic": "",
         "google": "",
         "openrouter": ""
-    },
-    "ollama": {
+    }),
+    "ollama": MappingProxyType({
         "host": "http://localhost:11434",
         "api_key": ""
-    }
-}
+    })
+})
 
-# Default general settings
-DEFAULT_GENERAL_SETTINGS = {
+# Default general settings (immutable)
+DEFAULT_GENERAL_SETTINGS = MappingProxyType({
     "theme": "system",
     "auto_scroll": True
-}
+})
+
+
+def _default_config() -> Dict[str, Any]:
+    """Return a fresh, fully mutable copy of DEFAULT_CONFIG."""
+    config = dict(DEFAULT_CONFIG)
+    config["api_keys"] = dict(DEFAULT_CONFIG["api_keys"])
+    config["ollama"] = dict(DEFAULT_CONFIG["ollama"])
+    return config
+
+
+def _default_mcp_servers() -> List[Dict[str, Any]]:
+    """Return a fresh, fully mutable copy of DEFAULT_MCP_SERVERS."""
+    return [dict(server) for server in DEFAULT_MCP_SERVERS]
+
+# Parsed-file caches keyed by (mtime_ns, size, inode). When the file on
+# disk is unchanged a load costs one stat() instead of open+read+json
+# parse; savers update the cache so writers and readers stay coherent.
+# Size and inode guard against edits mtime alone can miss: same-size
+# in-place rewrites on coarse-mtime filesystems, and atomic os.replace
+# swaps that carry over a timestamp.
+_config_cache = {"key": None, "data": None, "last_buf": None}
+
+# True when the saved config has changed since environment variables were
+# last exported; lets back-to-back setters defer the putenv round-trips
+_env_dirty = True
+_mcp_servers_cache = {"key": None, "data": None, "by_id": None, "last_buf": None}
+_general_settings_cache = {"key": None, "data": None, "last_buf": None}
+
+
+def _stat_key(stat: os.stat_result) -> tuple:
+    """Cache-validity key for a config file's stat result."""
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+def _index_mcp_servers(servers: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Build an id -> server index so mutations don't scan the list."""
+    return {server["id"]: server for server in servers
+            if isinstance(server, dict) and "id" in server}
+
+
+def _atomic_write_json(path: str, obj: Any) -> None:
+    """Atomically write obj as JSON to path with secure permissions.
+
+    The data is written to a temp sibling created with mode 0o600 (so no
+    follow-up chmod is needed and the file is never world-readable),
+    fsynced once, then renamed over the target. A crash mid-write can
+    never leave a truncated or insecure config file behind.
+    """
+    _atomic_write_bytes(path, json_io.dumps(obj))
+
+
+def _atomic_write_bytes(path: str, buf: bytes) -> None:
+    """Atomically write pre-serialised bytes; see _atomic_write_json."""
+    tmp_path = path + ".tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(buf)
+            f.flush()
+            os.fsync(f.fileno())
+    except Exception:
+        os.unlink(tmp_path)
+        raise
+    os.replace(tmp_path, path)
+
+
+class ConfigTransaction:
+    """
+    Context manager that batches configuration updates.
+
+    Performs exactly one load on enter and one save on a clean exit,
+    regardless of how many fields the caller updates. The save result is
+    available as `saved` after the block; nothing is written if the block
+    raises.
+    """
+
+    def __init__(self):
+        self.config = None
+        self.saved = False
+
+    def __enter__(self) -> Dict[str, Any]:
+        self.config = ConfigurationService.load_config()
+        return self.config
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.saved = ConfigurationService.save_config(self.config)
+        return False
 
 
 class ConfigurationService:
@@ -72,55 +164,83 @@ class ConfigurationService:
     including LLM API keys, MCP servers, and general settings.
     """
 
+    _instance = None
+
+    @classmethod
+    def instance(cls) -> "ConfigurationService":
+        """Get the shared ConfigurationService instance.
+
+        The instance binds to the mtime-cached config, so repeated
+        attribute access never re-reads the file; prefer the module-level
+        `cfg` binding over stacking static load_config calls.
+        """
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @property
+    def config(self) -> Dict[str, Any]:
+        """The current configuration dict (served from the mtime cache)."""
+        return ConfigurationService.load_config()
+
+    _config_dir_ready = False
+
     @staticmethod
     def ensure_config_dir():
-        """Ensure the configuration directory exists."""
-        os.makedirs(CONFIG_DIR, exist_ok=True)
+        """Ensure the configuration directory exists.
+
+        Every load and save funnels through here, so the mkdir syscall
+        is only issued once per process; a created directory doesn't
+        disappear in normal operation.
+        """
+        if not ConfigurationService._config_dir_ready:
+            os.makedirs(CONFIG_DIR, exist_ok=True)
+            ConfigurationService._config_dir_ready = True
 
     @staticmethod
     def load_config() -> Dict[str, Any]:
         """Load configuration from file."""
         ConfigurationService.ensure_config_dir()
 
-        if not os.path.exists(CONFIG_FILE):
-            # Create default configuration file
-            ConfigurationService.save_config(DEFAULT_CONFIG)
-            return DEFAULT_CONFIG.copy()
-
         try:
-            with open(CONFIG_FILE, "r") as f:
-                config = json.load(f)
-
-            # Ensure the config has the expected structure
-            if "api_keys" not in config:
-                config["api_keys"] = DEFAULT_CONFIG["api_keys"].copy()
-            else:
-                # Ensure all expected keys exist in api_keys
-                for key in DEFAULT_CONFIG["api_keys"]:
-                    if key not in config["api_keys"]:
-                        config["api_keys"][key] = DEFAULT_CONFIG["api_keys"][key]
+            stat = os.stat(CONFIG_FILE)
+        except OSError:
+            # Create default configuration file
+            config = _default_config()
+            ConfigurationService.save_config(config)
+            return config
 
-            # Ensure ollama config exists
-            if "ollama" not in config:
-                config["ollama"] = DEFAULT_CONFIG["ollama"].copy()
-            elif not isinstance(config["ollama"], dict):
-                config["ollama"] = DEFAULT_CONFIG["ollama"].copy()
-            else:
-                # Ensure all expected keys exist in ollama
-                for key in DEFAULT_CONFIG["ollama"]:
-                    if key not in config["ollama"]:
-                        config["ollama"][key] = DEFAULT_CONFIG["ollama"][key]
+        # Serve the cached parse when the file hasn't changed on disk
+        if _stat_key(stat) == _config_cache["key"]:
+            return _config_cache["data"]
 
-            # Ensure default provider and model exist
-            if "default_llm_provider" not in config:
-                config["default_llm_provider"] = DEFAULT_CONFIG["default_llm_provider"]
-            if "default_llm_model" not in config:
-                config["default_llm_model"] = DEFAULT_CONFIG["default_llm_model"]
+        try:
+            with open(CONFIG_FILE, "rb") as f:
+                config = json_io.loads(f.read())
+
+            # Ensure the config has the expected structure: overlay the
+            # file contents onto the defaults with C-level dict merges
+            # instead of per-key membership checks
+            api_keys = config.get("api_keys")
+            ollama = config.get("ollama")
+            config = {**DEFAULT_CONFIG, **config}
+            config["api_keys"] = {**DEFAULT_CONFIG["api_keys"],
+                                  **(api_keys if isinstance(api_keys, dict) else {})}
+            config["ollama"] = {**DEFAULT_CONFIG["ollama"],
+                                **(ollama if isinstance(ollama, dict) else {})}
+
+            _config_cache["key"] = _stat_key(stat)
+            _config_cache["data"] = config
+            # The file changed under us, so the bytes from the last
+            # save no longer describe what is on disk; without this a
+            # later save of that same payload would be skipped as a
+            # no-op and never overwrite the external edit
+            _config_cache["last_buf"] = None
 
             return config
         except Exception as e:
             logger.error(f"Error loading configuration: {e}")
-            return DEFAULT_CONFIG.copy()
+            return _default_config()
 
     @staticmethod
     def save_config(config: Dict[str, Any]) -> bool:
@@ -128,20 +248,43 @@ class ConfigurationService:
         ConfigurationService.ensure_config_dir()
 
         try:
-            with open(CONFIG_FILE, "w") as f:
-                json.dump(config, f, indent=2)
+            buf = json_io.dumps(config)
+
+            # No-op save: identical bytes are already on disk, so skip
+            # the write (and the env-var re-export) entirely
+            if buf == _config_cache["last_buf"]:
+                _config_cache["data"] = config
+                return True
 
-            # Set secure permissions (owner read/write only)
-            os.chmod(CONFIG_FILE, 0o600)
+            _atomic_write_bytes(CONFIG_FILE, buf)
 
-            # Update environment variables
-            ConfigurationService.update_environment_variables(config)
+            # Keep the cache coherent with what was just written
+            _config_cache["key"] = _stat_key(os.stat(CONFIG_FILE))
+            _config_cache["data"] = config
+            _config_cache["last_buf"] = buf
+
+            # Environment variables are re-exported lazily (see
+            # sync_env_if_dirty) so setter bursts don't repeat putenv
+            global _env_dirty
+            _env_dirty = True
 
             return True
         except Exception as e:
             logger.error(f"Error saving configuration: {e}")
             return False
 
+    @staticmethod
+    def sync_env_if_dirty():
+        """Export configuration to environment variables if stale.
+
+        Call once at startup and right before spawning LLM clients;
+        no-ops unless save_config has run since the last sync.
+        """
+        global _env_dirty
+        if _env_dirty:
+            ConfigurationService.update_environment_variables(ConfigurationService.load_config())
+            _env_dirty = False
+
     @staticmethod
     def update_environment_variables(config: Dict[str, Any]):
         """Update environment variables based on configuration."""
@@ -185,24 +328,37 @@ class ConfigurationService:
         return ""
 
     @staticmethod
-    def set_api_key(provider: str, api_key: str) -> bool:
-        """Set the API key for a specific provider."""
-        config = ConfigurationService.load_config()
+    def config_transaction() -> "ConfigTransaction":
+        """Open a transaction for batched configuration updates.
 
-        # Special case for ollama which has a nested structure
-        if provider == "ollama":
-            if "ollama" not in config or not isinstance(config["ollama"], dict):
-                config["ollama"] = DEFAULT_CONFIG["ollama"].copy()
-            config["ollama"]["api_key"] = api_key
-        else:
-            # Ensure api_keys exists
-            if "api_keys" not in config:
-                config["api_keys"] = DEFAULT_CONFIG["api_keys"].copy()
+        The configuration is loaded once on enter and saved once on a
+        clean exit, so callers updating several fields pay one read and
+        one write instead of a load/save cycle per field:
+
+            with ConfigurationService.config_transaction() as config:
+                config["default_llm_provider"] = provider
+                config["default_llm_model"] = model
+        """
+        return ConfigTransaction()
 
-            # Update the API key
-            config["api_keys"][provider] = api_key
+    @staticmethod
+    def set_api_key(provider: str, api_key: str) -> bool:
+        """Set the API key for a specific provider."""
+        transaction = ConfigurationService.config_transaction()
+        with transaction as config:
+            # Special case for ollama which has a nested structure
+            if provider == "ollama":
+                if "ollama" not in config or not isinstance(config["ollama"], dict):
+                    config["ollama"] = DEFAULT_CONFIG["ollama"].copy()
+                config["ollama"]["api_key"] = api_key
+            else:
+                # Ensure api_keys exists
+                if "api_keys" not in config:
+                    config["api_keys"] = DEFAULT_CONFIG["api_keys"].copy()
 
-        return ConfigurationService.save_config(config)
+                # Update the API key
+                config["api_keys"][provider] = api_key
+        return transaction.saved
 
     @staticmethod
     def get_default_provider() -> str:
@@ -219,16 +375,18 @@ class ConfigurationService:
     @staticmethod
     def set_default_provider(provider: str) -> bool:
         """Set the default LLM provider."""
-        config = ConfigurationService.load_config()
-        config["default_llm_provider"] = provider
-        return ConfigurationService.save_config(config)
+        transaction = ConfigurationService.config_transaction()
+        with transaction as config:
+            config["default_llm_provider"] = provider
+        return transaction.saved
 
     @staticmethod
     def set_default_model(model: str) -> bool:
         """Set the default LLM model."""
-        config = ConfigurationService.load_config()
-        config["default_llm_model"] = model
-        return ConfigurationService.save_config(config)
+        transaction = ConfigurationService.config_transaction()
+        with transaction as config:
+            config["default_llm_model"] = model
+        return transaction.saved
 
     @staticmethod
     def get_ollama_host() -> str:
@@ -241,11 +399,12 @@ class ConfigurationService:
     @staticmethod
     def set_ollama_host(host: str) -> bool:
         """Set the Ollama host."""
-        config = ConfigurationService.load_config()
-        if "ollama" not in config or not isinstance(config["ollama"], dict):
-            config["ollama"] = DEFAULT_CONFIG["ollama"].copy()
-        config["ollama"]["host"] = host
-        return ConfigurationService.save_config(config)
+        transaction = ConfigurationService.config_transaction()
+        with transaction as config:
+            if "ollama" not in config or not isinstance(config["ollama"], dict):
+                config["ollama"] = DEFAULT_CONFIG["ollama"].copy()
+            config["ollama"]["host"] = host
+        return transaction.saved
 
     # MCP Servers methods
     @staticmethod
@@ -253,26 +412,39 @@ class ConfigurationService:
         """Load MCP servers from file."""
         ConfigurationService.ensure_config_dir()
 
-        if not os.path.exists(MCP_SERVERS_FILE):
+        try:
+            stat = os.stat(MCP_SERVERS_FILE)
+        except OSError:
             # Create MCP servers file with default servers
-            ConfigurationService.save_mcp_servers(DEFAULT_MCP_SERVERS)
-            return DEFAULT_MCP_SERVERS.copy()
+            servers = _default_mcp_servers()
+            ConfigurationService.save_mcp_servers(servers)
+            return servers
+
+        # Serve the cached parse when the file hasn't changed on disk
+        if _stat_key(stat) == _mcp_servers_cache["key"]:
+            return _mcp_servers_cache["data"]
 
         try:
-            with open(MCP_SERVERS_FILE, "r") as f:
-                servers = json.load(f)
+            with open(MCP_SERVERS_FILE, "rb") as f:
+                servers = json_io.loads(f.read())
 
             # Check if we need to add any default servers that aren't already in the list
             if isinstance(servers, list):
                 existing_ids = {server.get("id") for server in servers if isinstance(server, dict) and "id" in server}
                 for default_server in DEFAULT_MCP_SERVERS:
                     if default_server["id"] not in existing_ids:
-                        servers.append(default_server)
+                        servers.append(dict(default_server))
                         logger.info(f"Added default MCP server: {default_server['name']}")
             else:
                 # If servers is not a list, replace it with the default servers
                 logger.warning("MCP servers data is not in the expected format, using defaults")
-                servers = DEFAULT_MCP_SERVERS.copy()
+                servers = _default_mcp_servers()
+
+            _mcp_servers_cache["key"] = _stat_key(stat)
+            _mcp_servers_cache["data"] = servers
+            _mcp_servers_cache["by_id"] = _index_mcp_servers(servers)
+            # Externally changed file: drop the no-op-save fingerprint
+            _mcp_servers_cache["last_buf"] = None
 
             return servers
         except Exception as e:
@@ -285,11 +457,22 @@ class ConfigurationService:
         ConfigurationService.ensure_config_dir()
 
         try:
-            with open(MCP_SERVERS_FILE, "w") as f:
-                json.dump(servers, f, indent=2)
+            buf = json_io.dumps(servers)
+
+            # No-op save: identical bytes are already on disk, so skip
+            # the write entirely
+            if buf == _mcp_servers_cache["last_buf"]:
+                _mcp_servers_cache["data"] = servers
+                _mcp_servers_cache["by_id"] = _index_mcp_servers(servers)
+                return True
+
+            _atomic_write_bytes(MCP_SERVERS_FILE, buf)
 
-            # Set secure permissions (owner read/write only)
-            os.chmod(MCP_SERVERS_FILE, 0o600)
+            # Keep the cache coherent with what was just written
+            _mcp_servers_cache["key"] = _stat_key(os.stat(MCP_SERVERS_FILE))
+            _mcp_servers_cache["data"] = servers
+            _mcp_servers_cache["by_id"] = _index_mcp_servers(servers)
+            _mcp_servers_cache["last_buf"] = buf
 
             return True
         except Exception as e:
@@ -303,29 +486,65 @@ class ConfigurationService:
         servers.append(server)
         return ConfigurationService.save_mcp_servers(servers)
 
+    @staticmethod
+    def load_state() -> Dict[str, Any]:
+        """Load all configuration state in one call.
+
+        Returns a dict with "config", "mcp_servers", and "general"
+        sub-keys. Boot paths that need several files should use this
+        instead of calling the individual loaders from scattered call
+        sites; the mtime caches make the repeat loads stat-only.
+        """
+        return {
+            "config": ConfigurationService.load_config(),
+            "mcp_servers": ConfigurationService.load_mcp_servers(),
+            "general": ConfigurationService.load_general_settings(),
+        }
+
+    @staticmethod
+    def load_mcp_server_index() -> List[Dict[str, Any]]:
+        """Load minimal MCP server metadata (id/name/description/url).
+
+        Startup code that only needs to know which servers exist should
+        use this instead of load_mcp_servers; full configs are fetched on
+        demand via get_mcp_server.
+        """
+        index_fields = ("id", "name", "description", "url", "local", "default")
+        return [{field: server[field] for field in index_fields if field in server}
+                for server in ConfigurationService.load_mcp_servers()]
+
+    @staticmethod
+    def get_mcp_server(server_id: str) -> Optional[Dict[str, Any]]:
+        """Get the full configuration for a single MCP server."""
+        return ConfigurationService._mcp_servers_by_id().get(server_id)
+
+    @staticmethod
+    def _mcp_servers_by_id() -> Dict[str, Dict[str, Any]]:
+        """Get the id -> server index for the current server list."""
+        servers = ConfigurationService.load_mcp_servers()
+        if _mcp_servers_cache["data"] is servers and _mcp_servers_cache["by_id"] is not None:
+            return _mcp_servers_cache["by_id"]
+        return _index_mcp_servers(servers)
+
     @staticmethod
     def update_mcp_server(server_id: str, server_data: Dict[str, Any]) -> bool:
         """Update an existing MCP server."""
-        servers = ConfigurationService.load_mcp_servers()
-        for i, server in enumerate(servers):
-            if server.get("id") == server_id:
-                # Update server data
-                servers[i] = server_data
-                return ConfigurationService.save_mcp_servers(servers)
+        servers_by_id = ConfigurationService._mcp_servers_by_id()
+        if server_id not in servers_by_id:
+            return False
 
-        return False
+        # O(1) dict update; the JSON schema on disk stays a list
+        servers_by_id[server_id] = server_data
+        return ConfigurationService.save_mcp_servers(list(servers_by_id.values()))
 
     @staticmethod
     def delete_mcp_server(server_id: str) -> bool:
         """Delete an MCP server."""
-        servers = ConfigurationService.load_mcp_servers()
-        for i, server in enumerate(servers):
-            if server.get("id") == server_id:
-                # Remove server
-                servers.pop(i)
-                return ConfigurationService.save_mcp_servers(servers)
+        servers_by_id = ConfigurationService._mcp_servers_by_id()
+        if servers_by_id.pop(server_id, None) is None:
+            return False
 
-        return False
+        return ConfigurationService.save_mcp_servers(list(servers_by_id.values()))
 
     # General settings methods
     @staticmethod
@@ -333,24 +552,36 @@ class ConfigurationService:
         """Load general settings from file."""
         ConfigurationService.ensure_config_dir()
 
-        if not os.path.exists(GENERAL_SETTINGS_FILE):
+        try:
+            stat = os.stat(GENERAL_SETTINGS_FILE)
+        except OSError:
             # Create default general settings file
-            ConfigurationService.save_general_settings(DEFAULT_GENERAL_SETTINGS)
-            return DEFAULT_GENERAL_SETTINGS.copy()
+            settings = dict(DEFAULT_GENERAL_SETTINGS)
+            ConfigurationService.save_general_settings(settings)
+            return settings
+
+        # Serve the cached parse when the file hasn't changed on disk
+        if _stat_key(stat) == _general_settings_cache["key"]:
+            return _general_settings_cache["data"]
 
         try:
-            with open(GENERAL_SETTINGS_FILE, "r") as f:
-                settings = json.load(f)
+            with open(GENERAL_SETTINGS_FILE, "rb") as f:
+                settings = json_io.loads(f.read())
 
             # Ensure all expected keys exist
             for key, value in DEFAULT_GENERAL_SETTINGS.items():
                 if key not in settings:
                     settings[key] = value
 
+            _general_settings_cache["key"] = _stat_key(stat)
+            _general_settings_cache["data"] = settings
+            # Externally changed file: drop the no-op-save fingerprint
+            _general_settings_cache["last_buf"] = None
+
             return settings
         except Exception as e:
             logger.error(f"Error loading general settings: {e}")
-            return DEFAULT_GENERAL_SETTINGS.copy()
+            return dict(DEFAULT_GENERAL_SETTINGS)
 
     @staticmethod
     def save_general_settings(settings: Dict[str, Any]) -> bool:
@@ -358,13 +589,27 @@ class ConfigurationService:
         ConfigurationService.ensure_config_dir()
 
         try:
-            with open(GENERAL_SETTINGS_FILE, "w") as f:
-                json.dump(settings, f, indent=2)
+            buf = json_io.dumps(settings)
+
+            # No-op save: identical bytes are already on disk, so skip
+            # the write entirely
+            if buf == _general_settings_cache["last_buf"]:
+                _general_settings_cache["data"] = settings
+                return True
 
-            # Set secure permissions (owner read/write only)
-            os.chmod(GENERAL_SETTINGS_FILE, 0o600)
+            _atomic_write_bytes(GENERAL_SETTINGS_FILE, buf)
+
+            # Keep the cache coherent with what was just written
+            _general_settings_cache["key"] = _stat_key(os.stat(GENERAL_SETTINGS_FILE))
+            _general_settings_cache["data"] = settings
+            _general_settings_cache["last_buf"] = buf
 
             return True
         except Exception as e:
             logger.error(f"Error saving general settings: {e}")
             return False
+
+
+# Shared instance for callers that prefer bound access over the static
+# funnel (e.g. `from exo.core.configuration import cfg`)
+cfg = ConfigurationService.instance()
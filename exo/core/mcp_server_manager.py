@@ -2,13 +2,15 @@
 MCP Server Manager for handling local and remote MCP servers.
 """
 
-import json
 import logging
 import os
+import socket
 import subprocess
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional
+from urllib.parse import urlparse
 import requests
 
 from exo.core.configuration import ConfigurationService
@@ -28,16 +30,84 @@ class MCPServerManager:
     def __init__(self):
         """Initialize the MCP Server Manager."""
         self.local_servers = {}  # Store local server processes
-        
+        self.server_index = []  # Minimal metadata for configured servers
+
+        # Persistent session so repeated health probes (including the
+        # startup poll) reuse connections instead of rebuilding a pool
+        # adapter per request
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        self._session.mount("http://", adapter)
+
     def initialize_servers(self):
-        """Initialize all configured MCP servers."""
-        servers = ConfigurationService.load_mcp_servers()
-        
-        # Start any local servers that are marked as default
-        for server in servers:
-            if server.get("local") and server.get("default"):
-                self.ensure_local_server_running(server)
-    
+        """Initialize all configured MCP servers.
+
+        Only the server index is loaded here; health probes and
+        subprocess launches are deferred to the first ensure_running call
+        for a server, so startup costs a single file read instead of up
+        to 2 seconds of blocking HTTP per local server.
+        """
+        self.server_index = ConfigurationService.load_mcp_server_index()
+
+    def start_default_servers(self):
+        """Eagerly start all default local MCP servers.
+
+        Health probes run concurrently, so the worst case is one probe
+        timeout rather than one per server; only servers that came back
+        down are started.
+        """
+        servers = [server for server in ConfigurationService.load_mcp_servers()
+                   if server.get("local") and server.get("default")]
+        if not servers:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(8, len(servers))) as pool:
+            statuses = list(pool.map(
+                lambda server: self._check_server_status(server.get("url")),
+                servers
+            ))
+
+        for server, running in zip(servers, statuses):
+            if running:
+                logger.info(f"Local MCP server {server.get('id')} is already running at {server.get('url')}")
+            else:
+                self._start_local_server(server)
+
+    def _start_local_server(self, server: Dict[str, Any]) -> bool:
+        """Start a local MCP server process for the given config."""
+        server_id = server.get("id")
+
+        if server_id == "filesystem":
+            return self._start_filesystem_server(server)
+
+        # Add other local server types here
+
+        logger.warning(f"Unknown local MCP server type: {server_id}")
+        return False
+
+    def ensure_running(self, server_id: str) -> bool:
+        """
+        Ensure the given MCP server is running, starting it if needed.
+
+        Called lazily on the first invocation targeting a server.
+
+        Args:
+            server_id: ID of the server to check
+
+        Returns:
+            bool: True if the server is running, False otherwise
+        """
+        server = ConfigurationService.get_mcp_server(server_id)
+        if server is None:
+            logger.warning(f"Unknown MCP server: {server_id}")
+            return False
+
+        if server.get("local"):
+            return self.ensure_local_server_running(server)
+
+        # Remote servers are assumed reachable; callers surface errors
+        return True
+
     def ensure_local_server_running(self, server: Dict[str, Any]) -> bool:
         """
         Ensure a local MCP server is running.
@@ -55,15 +125,9 @@ class MCPServerManager:
         if self._check_server_status(server_url):
             logger.info(f"Local MCP server {server_id} is already running at {server_url}")
             return True
-        
+
         # If it's not running, try to start it
-        if server_id == "filesystem":
-            return self._start_filesystem_server(server)
-        
-        # Add other local server types here
-        
-        logger.warning(f"Unknown local MCP server type: {server_id}")
-        return False
+        return self._start_local_server(server)
     
     def _check_server_status(self, url: str) -> bool:
         """
@@ -76,11 +140,32 @@ class MCPServerManager:
             bool: True if the server is running, False otherwise
         """
         try:
-            response = requests.get(f"{url}/health", timeout=2)
+            response = self._session.get(f"{url}/health", timeout=2)
             return response.status_code == 200
         except Exception:
             return False
     
+    def _is_port_open(self, host: str, port: int, timeout: float = 0.1) -> bool:
+        """
+        Check whether a TCP connection to host:port succeeds.
+
+        Much cheaper than an HTTP round-trip for loopback liveness
+        polling; use _check_server_status when actual health matters.
+
+        Args:
+            host: Host to connect to
+            port: Port to connect to
+            timeout: Connect timeout in seconds
+
+        Returns:
+            bool: True if the port accepted the connection
+        """
+        try:
+            with socket.create_connection((host, port), timeout=timeout):
+                return True
+        except OSError:
+            return False
+
     def _start_filesystem_server(self, server: Dict[str, Any]) -> bool:
         """
         Start the filesystem MCP server.
@@ -92,29 +177,47 @@ class MCPServerManager:
             bool: True if the server was started successfully, False otherwise
         """
         try:
-            # Get the server URL and extract the port
+            # Get the server URL and extract the port; urlparse handles
+            # paths, query strings, and IPv6 hosts that a naive
+            # split(":") would mis-parse
             url = server.get("url", "http://localhost:8090")
-            port = url.split(":")[-1]
+            parsed = urlparse(url)
+            host = parsed.hostname or "localhost"
+            port = str(parsed.port or 8090)
             
-            # Start the server as a subprocess
+            # Start the server as a subprocess. Output goes to DEVNULL
+            # because nothing reads the pipes (a full pipe buffer would
+            # deadlock the server); start_new_session puts it in its own
+            # process group so a stuck server can be signalled as a group.
             cmd = ["python", "-m", "exo.mcp.filesystem", "--port", port]
             process = subprocess.Popen(
                 cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True
             )
             
             # Store the process
             self.local_servers[server.get("id")] = process
-            
-            # Wait for the server to start
-            for _ in range(5):  # Try for 5 seconds
-                if self._check_server_status(url):
+
+            # Wait for the server to start, polling with exponential
+            # backoff so fast startups are detected in tens of ms while
+            # a dead server still caps the total wait at ~3 seconds
+            delay = 0.025
+            total = 0.0
+            while total < 3.0:
+                # A TCP connect is enough for readiness polling and far
+                # cheaper than an HTTP GET per probe
+                if self._is_port_open(host, int(port)):
                     logger.info(f"Filesystem MCP server started at {url}")
                     return True
-                time.sleep(1)
-            
+                if process.poll() is not None:
+                    logger.error(f"Filesystem MCP server exited with code {process.returncode}")
+                    return False
+                time.sleep(delay)
+                total += delay
+                delay = min(delay * 2, 0.5)
+
             logger.warning(f"Filesystem MCP server started but not responding at {url}")
             return False
         except Exception as e:
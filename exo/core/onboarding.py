@@ -7,32 +7,147 @@ and storing configuration for future use.
 """
 
 import os
-import json
+import hashlib
 import logging
-import getpass
-import requests
+import selectors
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from types import MappingProxyType
+from typing import Dict, List, NamedTuple, Optional, Any, Tuple
 
 from exo.core.configuration import ConfigurationService
 
 logger = logging.getLogger(__name__)
 
-# Define required environment variables for different services
-REQUIRED_ENV_VARS = {
-    "llm": [
-        {"name": "OPENAI_API_KEY", "description": "OpenAI API key for LLM services", "secret": True, "required": False},
-        {"name": "ANTHROPIC_API_KEY", "description": "Anthropic API key for Claude models", "secret": True, "required": False},
-        {"name": "GOOGLE_API_KEY", "description": "Google API key for Gemini models", "secret": True, "required": False},
-        {"name": "OPENROUTER_API_KEY", "description": "OpenRouter API key for accessing multiple LLM providers", "secret": True, "required": False},
-        {"name": "OLLAMA_BASE_URL", "description": "Base URL for Ollama (default: http://localhost:11434)", "secret": False, "required": False, "default": "http://localhost:11434"},
-        {"name": "DEFAULT_LLM_PROVIDER", "description": "Default LLM provider to use (openai, anthropic, google, openrouter, ollama)", "secret": False, "required": False, "default": "openai"},
-        {"name": "DEFAULT_LLM_MODEL", "description": "Default LLM model to use", "secret": False, "required": False, "default": "gpt-3.5-turbo"},
-    ],
-    "mcp": [
-        {"name": "MCP_SERVER_URL", "description": "URL of the MCP server", "secret": False, "required": True},
-        {"name": "MCP_API_KEY", "description": "API key for the MCP server", "secret": True, "required": True},
-    ],
+class EnvVar(NamedTuple):
+    """One required environment variable: schema for the prompt loops."""
+
+    name: str
+    description: str
+    secret: bool
+    required: bool
+    default: Optional[str] = None
+
+
+# Required environment variables for each service. Tuples of NamedTuples
+# behind a read-only proxy: the check/gather loops use C-level attribute
+# access instead of dict lookups, and nothing can mutate the schema at
+# runtime.
+REQUIRED_ENV_VARS = MappingProxyType({
+    "llm": (
+        EnvVar("OPENAI_API_KEY", "OpenAI API key for LLM services", True, False),
+        EnvVar("ANTHROPIC_API_KEY", "Anthropic API key for Claude models", True, False),
+        EnvVar("GOOGLE_API_KEY", "Google API key for Gemini models", True, False),
+        EnvVar("OPENROUTER_API_KEY", "OpenRouter API key for accessing multiple LLM providers", True, False),
+        EnvVar("OLLAMA_BASE_URL", "Base URL for Ollama (default: http://localhost:11434)", False, False, "http://localhost:11434"),
+        EnvVar("DEFAULT_LLM_PROVIDER", "Default LLM provider to use (openai, anthropic, google, openrouter, ollama)", False, False, "openai"),
+        EnvVar("DEFAULT_LLM_MODEL", "Default LLM model to use", False, False, "gpt-3.5-turbo"),
+    ),
+    "mcp": (
+        EnvVar("MCP_SERVER_URL", "URL of the MCP server", False, True),
+        EnvVar("MCP_API_KEY", "API key for the MCP server", True, True),
+    ),
+})
+
+# LLM provider probe table: (display name, config key, URL or callable
+# building the URL from the config value, header builder or None).
+# validate_llm_connection iterates this instead of repeating a
+# near-identical block per provider; adding a provider is one row.
+_PROVIDERS: Tuple[Tuple[str, str, Any, Optional[Any]], ...] = (
+    ("OpenAI", "OPENAI_API_KEY", "https://api.openai.com/v1/models",
+     lambda key: {"Authorization": f"Bearer {key}",
+                  "Content-Type": "application/json"}),
+    ("Anthropic", "ANTHROPIC_API_KEY", "https://api.anthropic.com/v1/models",
+     lambda key: {"x-api-key": key,
+                  "Content-Type": "application/json",
+                  "anthropic-version": "2023-06-01"}),
+    ("Google", "GOOGLE_API_KEY",
+     "https://generativelanguage.googleapis.com/v1beta/models",
+     lambda key: {"x-goog-api-key": key,
+                  "Content-Type": "application/json"}),
+    ("OpenRouter", "OPENROUTER_API_KEY", "https://openrouter.ai/api/v1/models",
+     lambda key: {"Authorization": f"Bearer {key}",
+                  "Content-Type": "application/json"}),
+    ("Ollama", "OLLAMA_BASE_URL", lambda base: f"{base}/api/tags", None),
+)
+
+
+# Cached MCPManager class; resolved on first interactive use so module
+# import stays cheap and the add-another loop doesn't re-run the
+# from-import machinery per iteration (see _get_mcp_manager)
+_MCPManager = None
+
+
+def _get_mcp_manager():
+    """Return the MCPManager class, importing it on first use."""
+    global _MCPManager
+    if _MCPManager is None:
+        from exo.agents.mcp_manager import MCPManager
+        _MCPManager = MCPManager
+    return _MCPManager
+
+
+def _mask_secret(value: str) -> str:
+    """Mask a secret for display, keeping the first and last 4 chars."""
+    n = len(value)
+    return f"{value[:4]}{'*' * (n - 8)}{value[-4:]}" if n > 8 else value
+
+
+# How long (seconds) an interactive prompt waits before giving up so an
+# abandoned session can't pin a worker thread forever
+INPUT_TIMEOUT = 300.0
+
+
+def _input_with_timeout(prompt: str, timeout: float = INPUT_TIMEOUT) -> str:
+    """
+    Read a line from stdin, raising TimeoutError if none arrives in time.
+
+    Uses selectors so a blocked prompt releases its thread after the
+    timeout instead of waiting forever. Falls back to the builtin input() when
+    stdin can't be multiplexed (e.g. Windows consoles or pipes that
+    selectors can't register).
+
+    Args:
+        prompt: Prompt written to stdout before waiting
+        timeout: Seconds to wait for input
+
+    Returns:
+        The entered line without its trailing newline
+
+    Raises:
+        TimeoutError: If no input arrived within the timeout
+    """
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+
+    sel = selectors.DefaultSelector()
+    try:
+        sel.register(sys.stdin, selectors.EVENT_READ)
+    except (ValueError, OSError, PermissionError):
+        sel.close()
+        return input()
+
+    try:
+        if not sel.select(timeout):
+            raise TimeoutError(f"No input received within {timeout:.0f}s")
+        line = sys.stdin.readline()
+    finally:
+        sel.close()
+
+    if not line:
+        raise EOFError("stdin closed while waiting for input")
+    return line.rstrip("\n")
+
+
+# Names that block a service when absent (required, no default); kept as
+# frozensets so the non-force check is pure C-level set algebra
+_REQUIRED_SETS: Dict[str, frozenset] = {
+    service: frozenset(
+        var.name for var in variables if var.required and var.default is None
+    )
+    for service, variables in REQUIRED_ENV_VARS.items()
 }
 
 class Onboarding:
@@ -44,6 +159,13 @@ class Onboarding:
     and storing configuration for future use.
     """
 
+    # How long (seconds) a validation probe result stays fresh
+    VALIDATION_CACHE_TTL = 30.0
+
+    # How long (seconds) a failed MCP probe suppresses retries against
+    # the same URL, so a down server isn't hammered in a tight loop
+    MCP_FAILURE_TTL = 10.0
+
     def __init__(self, config_dir: Optional[str] = None):
         """
         Initialize the onboarding process.
@@ -55,13 +177,30 @@ class Onboarding:
         self.config_file = os.path.join(self.config_dir, "config.json")
         self.mcp_servers_file = os.path.join(self.config_dir, "mcp_servers.json")
 
-        # Create config directory if it doesn't exist
-        os.makedirs(self.config_dir, exist_ok=True)
-
-        # Load configuration using the ConfigurationService
+        # Load configuration using the ConfigurationService (which
+        # creates the config directory on first touch; no separate
+        # mkdir/stat round-trips here)
         self.config = ConfigurationService.load_config()
         self.mcp_servers = ConfigurationService.load_mcp_servers()
 
+        # Shared session for validation probes, created on first use so
+        # constructing Onboarding for config-only calls never pays the
+        # requests/urllib3 import (see _get_session)
+        self._session = None
+
+        # Next free numeric suffix per server-id base, so repeated adds
+        # of similarly named servers don't rescan for a free slot
+        self._id_counters: Dict[str, int] = {}
+
+        # Monotonic timestamps of recent failed MCP probes, keyed by URL
+        self._mcp_failures: Dict[str, float] = {}
+
+        # Short-TTL cache of probe results so re-running onboarding or
+        # adding several servers doesn't re-pay full network latency;
+        # keyed by (provider, credential hash), cleared when env vars
+        # are re-gathered
+        self._validation_cache: Dict[Tuple[str, str], Tuple[float, bool]] = {}
+
     def _save_config(self):
         """Save configuration to file using the ConfigurationService."""
         success = ConfigurationService.save_config(self.config)
@@ -102,21 +241,14 @@ class Onboarding:
             logger.warning("Unknown service: %s", service)
             return True, []
 
-        missing_vars = []
-        for var in REQUIRED_ENV_VARS[service]:
-            var_name = var["name"]
-            is_required = var.get("required", True)
-            has_default = "default" in var
-
-            # If force is True, consider all variables as missing
-            if force:
-                missing_vars.append(var_name)
-            # Otherwise, only consider it missing if it's required and has no default
-            elif is_required and not has_default:
-                if var_name not in os.environ and var_name not in self.config:
-                    missing_vars.append(var_name)
+        # If force is True, every variable counts as missing
+        if force:
+            return False, [var.name for var in REQUIRED_ENV_VARS[service]]
 
-        return len(missing_vars) == 0, missing_vars
+        # Required-with-no-default names minus everything already set,
+        # resolved in one C-level set expression
+        missing = _REQUIRED_SETS[service] - os.environ.keys() - self.config.keys()
+        return not missing, list(missing)
 
     def gather_env_vars(self, service: str, interactive: bool = True, force: bool = False) -> bool:
         """
@@ -151,9 +283,9 @@ class Onboarding:
         all_required_set = True
 
         for var in REQUIRED_ENV_VARS[service]:
-            var_name = var["name"]
-            is_required = var.get("required", True)
-            has_default = "default" in var
+            var_name = var.name
+            default = var.default
+            has_default = default is not None
 
             if var_name in os.environ and not force:
                 # Environment variable is already set
@@ -165,14 +297,14 @@ class Onboarding:
                 continue
 
             # Prompt for the variable
-            print(f"\n{var['description']}:")
+            print(f"\n{var.description}:")
 
             # Show default if available
             prompt_suffix = ""
             if has_default:
-                prompt_suffix = f" (default: {var['default']})"
+                prompt_suffix = f" (default: {default})"
 
-            if var.get("secret", False):
+            if var.secret:
                 # For secret values like API keys, offer visibility options
                 print(f"Enter {var_name}{prompt_suffix}")
                 print("(API keys are long and complex. Choose how to enter this value:)")
@@ -180,35 +312,37 @@ class Onboarding:
                 print("2. Visible input (easier to verify)")
                 print("3. Masked input (shows partial key)")
 
-                input_choice = input("Choose option (1-3, default: 1): ").strip()
+                input_choice = _input_with_timeout("Choose option (1-3, default: 1): ").strip()
 
                 if input_choice == "2":
                     # Visible input
-                    value = input("Enter value (visible): ")
+                    value = _input_with_timeout("Enter value (visible): ")
                 elif input_choice == "3":
                     # Masked input that shows part of the key
-                    value = input("Enter value (will be partially masked): ")
+                    value = _input_with_timeout("Enter value (will be partially masked): ")
                     if value:
                         # Show only first 4 and last 4 characters
-                        masked = value[:4] + "*" * (len(value) - 8) + value[-4:] if len(value) > 8 else value
-                        print(f"You entered: {masked}")
-                        confirm = input("Is this correct? (y/n): ").lower()
+                        print(f"You entered: {_mask_secret(value)}")
+                        confirm = _input_with_timeout("Is this correct? (y/n): ").lower()
                         if confirm != "y":
-                            value = input("Enter value again: ")
+                            value = _input_with_timeout("Enter value again: ")
                 else:
-                    # Default to hidden input
+                    # Default to hidden input (getpass imported lazily;
+                    # only interactive secret prompts need it)
+                    import getpass
+
                     value = getpass.getpass("Enter value (hidden): ")
             else:
-                value = input(f"Enter {var_name}{prompt_suffix}: ")
+                value = _input_with_timeout(f"Enter {var_name}{prompt_suffix}: ")
 
             # Use default if no value provided and default exists
             if not value and has_default:
-                value = var["default"]
+                value = default
                 print(f"Using default value: {value}")
 
             if value:
                 self.config[var_name] = value
-            elif is_required:
+            elif var.required:
                 print(f"Warning: {var_name} is required but not provided")
                 all_required_set = False
             else:
@@ -217,12 +351,88 @@ class Onboarding:
         # Save the configuration
         self._save_config()
 
+        # Credentials may have changed; force fresh validation probes
+        self._validation_cache.clear()
+
         return all_required_set
 
+    def _get_session(self):
+        """
+        Return the shared validation session, creating it on first use.
+
+        The requests import (and its urllib3/certifi dependency tree) is
+        deferred to here so it is only paid when a validator actually
+        runs. The session is thread-safe for separate requests and
+        amortises TLS/connection setup across providers; pool sizing
+        matches the widest parallel probe fan-out, and retries stay off
+        so a dead provider fails in one timeout.
+        """
+        if self._session is None:
+            import requests
+
+            self._session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=8, pool_maxsize=8, max_retries=0
+            )
+            self._session.mount("https://", adapter)
+            self._session.mount("http://", adapter)
+        return self._session
+
+    def _probe_provider(self, provider: str, url: str,
+                        headers: Optional[Dict[str, str]] = None) -> bool:
+        """
+        Probe a single provider endpoint.
+
+        Args:
+            provider: Provider display name (for logging)
+            url: Endpoint to request
+            headers: Request headers, if any
+
+        Returns:
+            True if the endpoint answered 200
+        """
+        # Serve a recent result for the same credentials from the cache
+        fingerprint = hashlib.sha256(
+            repr((url, sorted((headers or {}).items()))).encode()
+        ).hexdigest()[:16]
+        cache_key = (provider, fingerprint)
+        cached = self._validation_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < self.VALIDATION_CACHE_TTL:
+            return cached[1]
+
+        ok = False
+        try:
+            # Only the status code matters, so probe with HEAD first and
+            # skip the multi-KB model listings some providers return.
+            # Providers that reject HEAD get a streamed GET whose body is
+            # never consumed — the status line is enough either way.
+            session = self._get_session()
+            response = session.head(url, headers=headers, timeout=5,
+                                    allow_redirects=False)
+            if response.status_code in (405, 501):
+                response = session.get(url, headers=headers, timeout=5,
+                                       stream=True)
+                response.close()
+            if response.status_code == 200:
+                logger.info("%s API connection validated", provider)
+                ok = True
+            else:
+                logger.warning("%s API connection failed with status %s",
+                               provider, response.status_code)
+        except Exception as e:
+            logger.warning("Error validating %s API connection: %s", provider, e)
+
+        self._validation_cache[cache_key] = (time.monotonic(), ok)
+        return ok
+
     def validate_llm_connection(self) -> bool:
         """
         Validate connection to LLM services.
 
+        Provider endpoints are independent, so all probes run
+        concurrently and the wall time is the slowest single provider
+        rather than the sum of the timeouts.
+
         Returns:
             True if at least one LLM provider connection is valid
         """
@@ -231,111 +441,25 @@ class Onboarding:
         if not all_vars_set:
             return False
 
-        # Track if any provider is valid
-        any_provider_valid = False
-
-        # Try OpenAI API
-        if "OPENAI_API_KEY" in self.config:
-            try:
-                api_key = self.config["OPENAI_API_KEY"]
-                headers = {
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json"
-                }
-                response = requests.get(
-                    "https://api.openai.com/v1/models",
-                    headers=headers,
-                    timeout=5
-                )
-                if response.status_code == 200:
-                    logger.info("OpenAI API connection validated")
-                    any_provider_valid = True
-                else:
-                    logger.warning("OpenAI API connection failed: %s", response.text)
-            except Exception as e:
-                logger.warning("Error validating OpenAI API connection: %s", e)
-
-        # Try Anthropic API
-        if "ANTHROPIC_API_KEY" in self.config:
-            try:
-                api_key = self.config["ANTHROPIC_API_KEY"]
-                headers = {
-                    "x-api-key": api_key,
-                    "Content-Type": "application/json",
-                    "anthropic-version": "2023-06-01"
-                }
-                response = requests.get(
-                    "https://api.anthropic.com/v1/models",
-                    headers=headers,
-                    timeout=5
-                )
-                if response.status_code == 200:
-                    logger.info("Anthropic API connection validated")
-                    any_provider_valid = True
-                else:
-                    logger.warning("Anthropic API connection failed: %s", response.text)
-            except Exception as e:
-                logger.warning("Error validating Anthropic API connection: %s", e)
-
-        # Try Google API
-        if "GOOGLE_API_KEY" in self.config:
-            try:
-                api_key = self.config["GOOGLE_API_KEY"]
-                headers = {
-                    "x-goog-api-key": api_key,
-                    "Content-Type": "application/json"
-                }
-                response = requests.get(
-                    "https://generativelanguage.googleapis.com/v1beta/models",
-                    headers=headers,
-                    timeout=5
-                )
-                if response.status_code == 200:
-                    logger.info("Google API connection validated")
-                    any_provider_valid = True
-                else:
-                    logger.warning("Google API connection failed: %s", response.text)
-            except Exception as e:
-                logger.warning("Error validating Google API connection: %s", e)
-
-        # Try OpenRouter API
-        if "OPENROUTER_API_KEY" in self.config:
-            try:
-                api_key = self.config["OPENROUTER_API_KEY"]
-                headers = {
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json"
-                }
-                response = requests.get(
-                    "https://openrouter.ai/api/v1/models",
-                    headers=headers,
-                    timeout=5
-                )
-                if response.status_code == 200:
-                    logger.info("OpenRouter API connection validated")
-                    any_provider_valid = True
-                else:
-                    logger.warning("OpenRouter API connection failed: %s", response.text)
-            except Exception as e:
-                logger.warning("Error validating OpenRouter API connection: %s", e)
-
-        # Try Ollama API
-        if "OLLAMA_BASE_URL" in self.config:
-            try:
-                base_url = self.config["OLLAMA_BASE_URL"]
-                response = requests.get(
-                    f"{base_url}/api/tags",
-                    timeout=5
-                )
-                if response.status_code == 200:
-                    logger.info("Ollama API connection validated")
-                    any_provider_valid = True
-                else:
-                    logger.warning("Ollama API connection failed: %s", response.text)
-            except Exception as e:
-                logger.warning("Error validating Ollama API connection: %s", e)
+        # Build a probe per configured provider from the table
+        probes = []
+        for provider, config_key, url, header_builder in _PROVIDERS:
+            value = self.config.get(config_key)
+            if not value:
+                continue
+            probes.append((
+                provider,
+                url(value) if callable(url) else url,
+                header_builder(value) if header_builder else None,
+            ))
 
-        return any_provider_valid
+        if not probes:
+            return False
+
+        with ThreadPoolExecutor(max_workers=len(probes)) as executor:
+            results = list(executor.map(lambda probe: self._probe_provider(*probe), probes))
+
+        return any(results)
 
     def validate_mcp_connection(self, server_id: Optional[str] = None) -> bool:
         """
@@ -347,78 +471,60 @@ class Onboarding:
         Returns:
             True if connection is valid
         """
-        # If no server ID is provided, use the default server
+        # Resolve the credentials first; missing ones fail fast without
+        # building headers or touching the network
         if server_id is None:
             # Check if required environment variables are set
             all_vars_set, _ = self.check_env_vars("mcp")
             if not all_vars_set:
                 return False
 
-            try:
-                url = self.config.get("MCP_SERVER_URL")
-                api_key = self.config.get("MCP_API_KEY")
-
-                if not url or not api_key:
-                    return False
-
-                headers = {
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json"
-                }
-
-                # Make a simple request to the MCP server
-                response = requests.get(
-                    f"{url}/api/status",
-                    headers=headers,
-                    timeout=5
-                )
-
-                if response.status_code == 200:
-                    logger.info("MCP server connection validated")
-                    return True
-                else:
-                    logger.warning("MCP server connection failed: %s", response.text)
-                    return False
-            except Exception as e:
-                logger.warning("Error validating MCP server connection: %s", e)
-                return False
+            url = self.config.get("MCP_SERVER_URL")
+            api_key = self.config.get("MCP_API_KEY")
+            label = "MCP server"
         else:
-            # Validate a specific MCP server
             if server_id not in self.mcp_servers:
                 logger.warning("Unknown MCP server: %s", server_id)
                 return False
 
             server = self.mcp_servers[server_id]
-            try:
-                url = server.get("url")
-                api_key = server.get("api_key")
-
-                if not url or not api_key:
-                    return False
-
-                headers = {
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json"
-                }
-
-                # Make a simple request to the MCP server
-                response = requests.get(
-                    f"{url}/api/status",
-                    headers=headers,
-                    timeout=5
-                )
-
-                if response.status_code == 200:
-                    logger.info("MCP server connection validated: %s", server_id)
-                    return True
-                else:
-                    logger.warning("MCP server connection failed: %s - %s",
-                                  server_id, response.text)
-                    return False
-            except Exception as e:
-                logger.warning("Error validating MCP server connection: %s - %s",
-                              server_id, e)
-                return False
+            url = server.get("url")
+            api_key = server.get("api_key")
+            label = f"MCP server {server_id}"
+
+        if not (url and api_key):
+            return False
+
+        # Negative-result cache: a probe that just failed stays failed
+        # for MCP_FAILURE_TTL so retry storms skip the round-trip
+        failed_at = self._mcp_failures.get(url)
+        if failed_at is not None and time.monotonic() - failed_at < self.MCP_FAILURE_TTL:
+            return False
+
+        headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json"
+        }
+
+        try:
+            # Make a simple request to the MCP server
+            response = self._get_session().get(
+                f"{url}/api/status",
+                headers=headers,
+                timeout=5
+            )
+
+            if response.status_code == 200:
+                logger.info("%s connection validated", label)
+                self._mcp_failures.pop(url, None)
+                return True
+
+            logger.warning("%s connection failed: %s", label, response.text)
+        except Exception as e:
+            logger.warning("Error validating %s connection: %s", label, e)
+
+        self._mcp_failures[url] = time.monotonic()
+        return False
 
     def add_mcp_server(self, interactive: bool = True) -> Optional[str]:
         """
@@ -438,12 +544,12 @@ class Onboarding:
         print("------------------------")
 
         # Get server details
-        server_name = input("Enter server name: ")
+        server_name = _input_with_timeout("Enter server name: ")
         if not server_name:
             print("Server name is required")
             return None
 
-        server_url = input("Enter server URL: ")
+        server_url = _input_with_timeout("Enter server URL: ")
         if not server_url:
             print("Server URL is required")
             return None
@@ -455,35 +561,41 @@ class Onboarding:
         print("2. Visible input (easier to verify)")
         print("3. Masked input (shows partial key)")
 
-        input_choice = input("Choose option (1-3, default: 1): ").strip()
+        input_choice = _input_with_timeout("Choose option (1-3, default: 1): ").strip()
 
         if input_choice == "2":
             # Visible input
-            server_api_key = input("Enter server API key (visible): ")
+            server_api_key = _input_with_timeout("Enter server API key (visible): ")
         elif input_choice == "3":
             # Masked input that shows part of the key
-            server_api_key = input("Enter server API key (will be partially masked): ")
+            server_api_key = _input_with_timeout("Enter server API key (will be partially masked): ")
             if server_api_key:
                 # Show only first 4 and last 4 characters
-                masked = server_api_key[:4] + "*" * (len(server_api_key) - 8) + server_api_key[-4:] if len(server_api_key) > 8 else server_api_key
-                print(f"You entered: {masked}")
-                confirm = input("Is this correct? (y/n): ").lower()
+                print(f"You entered: {_mask_secret(server_api_key)}")
+                confirm = _input_with_timeout("Is this correct? (y/n): ").lower()
                 if confirm != "y":
-                    server_api_key = input("Enter server API key again: ")
+                    server_api_key = _input_with_timeout("Enter server API key again: ")
         else:
-            # Default to hidden input
+            # Default to hidden input (lazy import as in gather_env_vars)
+            import getpass
+
             server_api_key = getpass.getpass("Enter server API key (hidden): ")
 
         if not server_api_key:
             print("Server API key is required")
             return None
 
-        # Generate a unique ID for the server
-        server_id = server_name.lower().replace(" ", "_")
-        counter = 1
+        # Generate a unique ID for the server. The per-base counter
+        # remembers the next free suffix, so the membership check below
+        # almost always passes first try; it only advances past ids that
+        # were already on disk when this session started.
+        base = server_name.lower().replace(" ", "_")
+        n = self._id_counters.get(base, 0)
+        server_id = base if n == 0 else f"{base}_{n}"
         while server_id in self.mcp_servers:
-            server_id = f"{server_name.lower().replace(' ', '_')}_{counter}"
-            counter += 1
+            n += 1
+            server_id = f"{base}_{n}"
+        self._id_counters[base] = n + 1
 
         # Add the server
         self.mcp_servers[server_id] = {
@@ -571,7 +683,7 @@ class Onboarding:
             print("2. Install a local MCP server on this machine")
             print("3. Skip MCP server setup for now")
 
-            choice = input("\nEnter your choice (1-3): ").strip()
+            choice = _input_with_timeout("\nEnter your choice (1-3): ").strip()
 
             if choice == "1":
                 # Gather MCP environment variables for remote server
@@ -613,25 +725,23 @@ class Onboarding:
         if interactive:
             # If user chose to install a local MCP server
             if choice == "2":
-                from exo.agents.mcp_manager import MCPManager
-                mcp_manager = MCPManager(self)
+                mcp_manager = _get_mcp_manager()(self)
                 server_id = mcp_manager.onboard_new_server(local=True)
                 if server_id:
                     local_mcp_installed = True
                     mcp_valid = True
 
             # Ask if they want to add more MCP servers
-            add_server = input("\nWould you like to add another MCP server? (y/n): ").lower()
+            add_server = _input_with_timeout("\nWould you like to add another MCP server? (y/n): ").lower()
             while add_server == "y":
                 # Ask if they want to add a local or remote server
                 if not local_mcp_installed:
                     print("\n1. Add a remote MCP server")
                     print("2. Install a local MCP server")
-                    server_choice = input("Enter your choice (1-2): ").strip()
+                    server_choice = _input_with_timeout("Enter your choice (1-2): ").strip()
 
                     if server_choice == "2":
-                        from exo.agents.mcp_manager import MCPManager
-                        mcp_manager = MCPManager(self)
+                        mcp_manager = _get_mcp_manager()(self)
                         server_id = mcp_manager.onboard_new_server(local=True)
                         if server_id:
                             local_mcp_installed = True
@@ -640,7 +750,7 @@ class Onboarding:
                 else:
                     self.add_mcp_server(interactive=True)
 
-                add_server = input("Would you like to add another MCP server? (y/n): ").lower()
+                add_server = _input_with_timeout("Would you like to add another MCP server? (y/n): ").lower()
 
         print("\nOnboarding complete!")
         if not llm_valid or not mcp_valid:
@@ -683,29 +793,35 @@ class Onboarding:
 
     def export_env_vars(self):
         """Export configuration as environment variables."""
-        for var_name, value in self.config.items():
-            # Skip None values, dictionaries, or convert them to empty strings
-            if value is None:
-                # Set to empty string instead of None
-                os.environ[var_name] = ""
-            elif isinstance(value, dict):
-                # Skip dictionaries (like api_keys and ollama)
-                continue
-            elif isinstance(value, str):
-                os.environ[var_name] = value
-            else:
-                # Convert other types to string
-                os.environ[var_name] = str(value)
+        # Build the full normalized mapping first, then publish it with a
+        # single os.environ.update instead of per-key __setitem__ calls.
+        # Dictionaries (api_keys, ollama) are skipped; None becomes "".
+        exported = {
+            var_name: "" if value is None
+            else value if isinstance(value, str)
+            else str(value)
+            for var_name, value in self.config.items()
+            if not isinstance(value, dict)
+        }
 
         # Handle API keys specifically
-        if "api_keys" in self.config and isinstance(self.config["api_keys"], dict):
-            for provider, key in self.config["api_keys"].items():
-                if key is not None and provider.upper() + "_API_KEY" not in os.environ:
-                    os.environ[provider.upper() + "_API_KEY"] = key
+        api_keys = self.config.get("api_keys")
+        if isinstance(api_keys, dict):
+            for provider, key in api_keys.items():
+                var_name = provider.upper() + "_API_KEY"
+                if key is not None and var_name not in os.environ and var_name not in exported:
+                    exported[var_name] = key
 
         # Handle Ollama settings
-        if "ollama" in self.config and isinstance(self.config["ollama"], dict):
-            if "host" in self.config["ollama"] and self.config["ollama"]["host"] is not None:
-                os.environ["OLLAMA_BASE_URL"] = self.config["ollama"]["host"]
+        ollama = self.config.get("ollama")
+        if isinstance(ollama, dict) and ollama.get("host") is not None:
+            exported["OLLAMA_BASE_URL"] = ollama["host"]
+
+        os.environ.update(exported)
 
         logger.info("Environment variables exported from configuration")
+
+    def close(self):
+        """Release the pooled validation connections, if any."""
+        if self._session is not None:
+            self._session.close()
@@ -6,10 +6,35 @@ ensuring that all components have access to the same service instances.
 """
 
 import logging
+import sys
+import threading
+from types import MappingProxyType
 from typing import Dict, Any, Optional, Type
 
 logger = logging.getLogger(__name__)
 
+
+class _ServiceDict(dict):
+    """Service mapping whose misses log and yield None.
+
+    Lookup hits stay entirely in C; the warning branch only runs when a
+    key is actually absent, via __missing__.
+    """
+
+    def __missing__(self, service_name):
+        logger.warning("Service not found: %s", service_name)
+        return None
+
+
+class _ServiceFactory:
+    """Deferred service: holds a zero-argument factory until first get()."""
+
+    __slots__ = ("factory",)
+
+    def __init__(self, factory):
+        self.factory = factory
+
+
 class ServiceRegistry:
     """
     Service Registry for the exo Multi-Agent Framework
@@ -19,12 +44,30 @@ class ServiceRegistry:
     """
     
     _instance = None
+    _lock = threading.Lock()
     
     def __new__(cls):
-        """Implement singleton pattern."""
-        if cls._instance is None:
-            cls._instance = super(ServiceRegistry, cls).__new__(cls)
-            cls._instance._services = {}
+        """Implement singleton pattern (double-checked locking)."""
+        # Steady state: one attribute read and branch, no lock
+        instance = cls._instance
+        if instance is not None:
+            return instance
+
+        with cls._lock:
+            # Re-check under the lock: another thread may have won
+            if cls._instance is None:
+                instance = super(ServiceRegistry, cls).__new__(cls)
+                instance._services = _ServiceDict()
+                instance._services_view = MappingProxyType(instance._services)
+                # Direct attribute slots for the well-known hot services;
+                # reading registry.mcp_manager is one attribute load
+                # instead of a string hash + dict probe through get()
+                instance.mcp_manager = None
+                instance.llm_manager = None
+                instance.onboarding = None
+                instance.system = None
+                # Publish only after the instance is fully initialised
+                cls._instance = instance
         return cls._instance
     
     def register(self, service_name: str, service_instance: Any) -> None:
@@ -36,21 +79,51 @@ class ServiceRegistry:
             service_instance: Instance of the service
         """
         self._services[service_name] = service_instance
-        logger.debug(f"Registered service: {service_name}")
-    
+        if service_name in _FAST_NAMES:
+            setattr(self, service_name, service_instance)
+        logger.debug("Registered service: %s", service_name)
+
+    def register_factory(self, service_name: str, factory: Any) -> None:
+        """
+        Register a service lazily.
+
+        The factory is a zero-argument callable invoked once, on the
+        first get() for the name; its result replaces the factory in
+        the registry, so every later lookup is a plain dict hit.
+
+        Args:
+            service_name: Name of the service
+            factory: Zero-argument callable building the service
+        """
+        self._services[service_name] = _ServiceFactory(factory)
+        if service_name in _FAST_NAMES:
+            setattr(self, service_name, None)
+        logger.debug("Registered service factory: %s", service_name)
+
     def get(self, service_name: str) -> Optional[Any]:
         """
         Get a service from the registry.
-        
+
         Args:
             service_name: Name of the service
-            
+
         Returns:
             Service instance, or None if not found
         """
-        service = self._services.get(service_name)
-        if service is None:
-            logger.warning(f"Service not found: {service_name}")
+        # Hits resolve in C; _ServiceDict.__missing__ handles the
+        # warning on the cold path
+        service = self._services[service_name]
+        if type(service) is _ServiceFactory:
+            with self._lock:
+                # Re-check under the lock: another thread may already
+                # have resolved the factory
+                service = self._services[service_name]
+                if type(service) is _ServiceFactory:
+                    service = service.factory()
+                    self._services[service_name] = service
+                    if service_name in _FAST_NAMES:
+                        setattr(self, service_name, service)
+                    logger.debug("Resolved service factory: %s", service_name)
         return service
     
     def has(self, service_name: str) -> bool:
@@ -74,11 +147,15 @@ class ServiceRegistry:
         """
         if service_name in self._services:
             del self._services[service_name]
-            logger.debug(f"Unregistered service: {service_name}")
+            if service_name in _FAST_NAMES:
+                setattr(self, service_name, None)
+            logger.debug("Unregistered service: %s", service_name)
     
     def clear(self) -> None:
         """Clear all services from the registry."""
         self._services.clear()
+        for service_name in _FAST_NAMES:
+            setattr(self, service_name, None)
         logger.debug("Cleared service registry")
     
     def get_all(self) -> Dict[str, Any]:
@@ -86,18 +163,33 @@ class ServiceRegistry:
         Get all registered services.
         
         Returns:
-            Dictionary of service names to service instances
+            A live read-only view of service names to service instances.
+            Callers needing a snapshot should copy it explicitly with
+            dict(registry.get_all()).
         """
-        return self._services.copy()
+        return self._services_view
 
 
 # Common service names
 class ServiceNames:
-    """Common service names used in the system."""
-    MCP_MANAGER = "mcp_manager"
-    LLM_MANAGER = "llm_manager"
-    ONBOARDING = "onboarding"
-    SYSTEM = "system"
+    """Common service names used in the system.
+
+    Values are interned so lookups hash an already-cached pointer
+    rather than re-hashing string contents.
+    """
+    MCP_MANAGER = sys.intern("mcp_manager")
+    LLM_MANAGER = sys.intern("llm_manager")
+    ONBOARDING = sys.intern("onboarding")
+    SYSTEM = sys.intern("system")
+
+
+# Fast-path service names mirrored onto registry attributes
+_FAST_NAMES = frozenset((
+    ServiceNames.MCP_MANAGER,
+    ServiceNames.LLM_MANAGER,
+    ServiceNames.ONBOARDING,
+    ServiceNames.SYSTEM,
+))
 
 
 # Helper functions for common operations
@@ -111,7 +203,9 @@ def get_service(service_name: str) -> Optional[Any]:
     Returns:
         Service instance, or None if not found
     """
-    return ServiceRegistry().get(service_name)
+    # Reads _instance directly: the common case skips the __new__
+    # call and its singleton branch entirely
+    return (ServiceRegistry._instance or ServiceRegistry()).get(service_name)
 
 def register_service(service_name: str, service_instance: Any) -> None:
     """
@@ -121,7 +215,44 @@ def register_service(service_name: str, service_instance: Any) -> None:
         service_name: Name of the service
         service_instance: Instance of the service
     """
-    ServiceRegistry().register(service_name, service_instance)
+    (ServiceRegistry._instance or ServiceRegistry()).register(service_name, service_instance)
+
+def register_service_factory(service_name: str, factory: Any) -> None:
+    """
+    Register a service lazily; the factory runs on first get_service().
+
+    Args:
+        service_name: Name of the service
+        factory: Zero-argument callable building the service
+    """
+    (ServiceRegistry._instance or ServiceRegistry()).register_factory(service_name, factory)
+
+def _get_fast(attr: str, service_name: str) -> Optional[Any]:
+    """Attribute-slot lookup with a factory-resolving fallback."""
+    registry = ServiceRegistry._instance
+    if registry is None:
+        return None
+    service = getattr(registry, attr)
+    if service is None and service_name in registry._services:
+        # Slot is empty but a lazy factory is registered: resolve it
+        service = registry.get(service_name)
+    return service
+
+def get_mcp_manager() -> Optional[Any]:
+    """Get the registered MCP manager via its attribute slot."""
+    return _get_fast("mcp_manager", ServiceNames.MCP_MANAGER)
+
+def get_llm_manager() -> Optional[Any]:
+    """Get the registered LLM manager via its attribute slot."""
+    return _get_fast("llm_manager", ServiceNames.LLM_MANAGER)
+
+def get_onboarding() -> Optional[Any]:
+    """Get the registered onboarding service via its attribute slot."""
+    return _get_fast("onboarding", ServiceNames.ONBOARDING)
+
+def get_system() -> Optional[Any]:
+    """Get the registered system service via its attribute slot."""
+    return _get_fast("system", ServiceNames.SYSTEM)
 
 def has_service(service_name: str) -> bool:
     """
@@ -133,4 +264,4 @@ def has_service(service_name: str) -> bool:
     Returns:
         True if the service is registered, False otherwise
     """
-    return ServiceRegistry().has(service_name)
+    return (ServiceRegistry._instance or ServiceRegistry()).has(service_name)
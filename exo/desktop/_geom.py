@@ -0,0 +1,66 @@
+"""
+Geometry kernels for desktop element lookup.
+
+The functions here operate on the Structure-of-Arrays rectangle layout
+kept by DesktopContext (four int32 arrays). When numba is installed the
+kernels are JIT-compiled to native code (cached on disk so the compile
+cost is paid once per machine, not per process); otherwise they run as
+plain NumPy, which is still vectorized.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op decorator stand-in when numba is not installed."""
+        def wrap(func):
+            return func
+        if args and callable(args[0]):
+            return args[0]
+        return wrap
+
+
+@njit(cache=True, fastmath=True)
+def hit_test(lefts, tops, rights, bottoms, x, y):
+    """
+    Index of the first rectangle containing (x, y), or -1.
+
+    Args:
+        lefts, tops, rights, bottoms: int32 rectangle edge arrays
+        x: X coordinate in pixels
+        y: Y coordinate in pixels
+
+    Returns:
+        Index into the arrays, or -1 when no rectangle contains the point
+    """
+    mask = (x >= lefts) & (x < rights) & (y >= tops) & (y < bottoms)
+    idx = np.argmax(mask)
+    if mask[idx]:
+        return idx
+    return -1
+
+
+@njit(cache=True, fastmath=True)
+def nearest(lefts, tops, rights, bottoms, x, y):
+    """
+    Index of the rectangle whose center is closest to (x, y), or -1.
+
+    Args:
+        lefts, tops, rights, bottoms: int32 rectangle edge arrays
+        x: X coordinate in pixels
+        y: Y coordinate in pixels
+
+    Returns:
+        Index into the arrays, or -1 when the arrays are empty
+    """
+    if lefts.size == 0:
+        return -1
+    cx = (lefts + rights) * 0.5
+    cy = (tops + bottoms) * 0.5
+    d2 = (cx - x) ** 2 + (cy - y) ** 2
+    return np.argmin(d2)
@@ -2,12 +2,72 @@
 Desktop Context component
 """
 
+import asyncio
+import base64
+import hashlib
 import logging
 import time
-from typing import Dict, List, Optional, Any
+from typing import Dict, NamedTuple, Optional, Any, Tuple
+
+import numpy as np
+
+from exo.desktop import _geom
 
 logger = logging.getLogger(__name__)
 
+
+class Rect(NamedTuple):
+    """Screen-space rectangle in pixels."""
+
+    left: int
+    top: int
+    right: int
+    bottom: int
+
+
+class UIElement(NamedTuple):
+    """One visible UI element: flat immutable record."""
+
+    type: str
+    text: str
+    rect: Rect
+    id: str
+
+
+class Screenshot:
+    """Raw screenshot bytes with base64 encoding deferred to first use.
+
+    Holding the raw bytes keeps a multi-MB capture at its native size;
+    the ASCII-doubled base64 form is only materialised (then cached)
+    when a transport boundary actually asks for it via b64.
+    """
+
+    __slots__ = ("raw", "_b64")
+
+    def __init__(self, raw: bytes):
+        self.raw = raw
+        self._b64 = None
+
+    @property
+    def b64(self) -> str:
+        """Base64-encoded form, computed on first access."""
+        if self._b64 is None:
+            self._b64 = base64.b64encode(self.raw).decode("ascii")
+        return self._b64
+
+
+# Placeholder pixel payload used by the stub capture path
+_STUB_SCREENSHOT_RAW = b"raw_image_data_would_go_here"
+
+
+# Stub element set, built once at import. Captures share this tuple
+# instead of re-allocating nested dicts per tick; NamedTuples keep the
+# fields as C-level attribute loads and the geometry as plain ints.
+_STUB_ELEMENTS: Tuple[UIElement, ...] = (
+    UIElement("button", "OK", Rect(100, 200, 200, 250), "ok-button"),
+    UIElement("textbox", "", Rect(100, 100, 500, 150), "input-field"),
+)
+
 class DesktopContext:
     """
     Desktop Context component
@@ -19,12 +79,90 @@ class DesktopContext:
     capture and analyze the desktop environment.
     """
 
+    # How long (seconds) a full-screen capture stays fresh; repeated
+    # polls inside this window reuse the previous result
+    CAPTURE_TTL = 0.1
+
     def __init__(self):
         """Initialize the desktop context."""
         self.last_capture = None
         self.last_capture_time = 0
+        # Monotonic clock for the TTL test, immune to wall-clock jumps
+        self._last_capture_monotonic = 0.0
+        # Structure-of-arrays rectangle index over the current elements;
+        # rebuilt whenever the element set changes (see
+        # _refresh_element_index)
+        self._elements: Tuple[UIElement, ...] = ()
+        self._rect_l = self._rect_t = self._rect_r = self._rect_b = None
+        # Digest of the last captured frame; an unchanged screen reuses
+        # the previous context instead of re-encoding and re-scraping
+        self._last_frame_hash = None
         logger.info("Desktop Context initialized")
 
+    @staticmethod
+    def _frame_hash(raw: bytes) -> bytes:
+        """Cheap digest of raw frame bytes for no-op detection."""
+        return hashlib.blake2b(raw, digest_size=8).digest()
+
+    def _refresh_element_index(self, elements: Tuple[UIElement, ...]) -> None:
+        """
+        Rebuild the SoA rectangle arrays for the given element set.
+
+        Hit-testing then runs as four contiguous int32 comparisons over
+        all rectangles at once instead of a Python-level scan.
+
+        Args:
+            elements: The current visible elements
+        """
+        if elements is self._elements:
+            return
+
+        self._elements = elements
+        rects = np.asarray([el.rect for el in elements], dtype=np.int32)
+        if rects.size:
+            self._rect_l = rects[:, 0]
+            self._rect_t = rects[:, 1]
+            self._rect_r = rects[:, 2]
+            self._rect_b = rects[:, 3]
+        else:
+            self._rect_l = self._rect_t = self._rect_r = self._rect_b = None
+
+    def find_element_at(self, x: int, y: int) -> Optional[UIElement]:
+        """
+        Find the visible element containing the given point.
+
+        Args:
+            x: X coordinate in pixels
+            y: Y coordinate in pixels
+
+        Returns:
+            The first matching UIElement, or None
+        """
+        if self._rect_l is None:
+            return None
+
+        idx = _geom.hit_test(self._rect_l, self._rect_t,
+                             self._rect_r, self._rect_b, x, y)
+        return self._elements[idx] if idx >= 0 else None
+
+    def find_nearest_element(self, x: int, y: int) -> Optional[UIElement]:
+        """
+        Find the visible element whose center is closest to the point.
+
+        Args:
+            x: X coordinate in pixels
+            y: Y coordinate in pixels
+
+        Returns:
+            The nearest UIElement, or None when nothing is visible
+        """
+        if self._rect_l is None:
+            return None
+
+        idx = _geom.nearest(self._rect_l, self._rect_t,
+                            self._rect_r, self._rect_b, x, y)
+        return self._elements[idx] if idx >= 0 else None
+
     def capture(self, region: Optional[Dict] = None) -> Dict:
         """
         Capture screenshot or other desktop context.
@@ -35,28 +173,114 @@ class DesktopContext:
         Returns:
             A dictionary containing the captured context
         """
-        logger.info(f"Capturing desktop context, region: {region}")
+        # Serve the cached frame for rapid repeat polls; region captures
+        # always go through since they may differ from the cached one
+        now = time.monotonic()
+        if (region is None and self.last_capture is not None
+                and now - self._last_capture_monotonic < self.CAPTURE_TTL):
+            return self.last_capture
+
+        logger.info("Capturing desktop context, region: %s", region)
+
+        # Unchanged frame: the hash check is far cheaper than element
+        # scraping plus encoding, so idle screens reuse the old context
+        raw = _STUB_SCREENSHOT_RAW
+        frame_hash = self._frame_hash(raw)
+        if (region is None and self.last_capture is not None
+                and frame_hash == self._last_frame_hash):
+            self.last_capture["timestamp"] = time.time()
+            self.last_capture_time = self.last_capture["timestamp"]
+            self._last_capture_monotonic = now
+            return self.last_capture
+
+        # Create a placeholder context. The real capture path is the
+        # async hooks below; there is no artificial delay here.
+        context = {
+            "timestamp": time.time(),
+            "screenshot": Screenshot(raw),
+            "active_window": self._get_active_window(),
+            "visible_elements": self._get_visible_elements(),
+            "region": region
+        }
+        self._refresh_element_index(context["visible_elements"])
 
-        # This is a placeholder for the actual screen capture
-        # In a real implementation, this would use platform-specific APIs
+        self.last_capture = context
+        self.last_capture_time = context["timestamp"]
+        self._last_capture_monotonic = now
+        self._last_frame_hash = frame_hash
 
-        # Simulate screen capture
-        time.sleep(0.2)  # Simulate processing time
+        return context
+
+    async def capture_async(self, region: Optional[Dict] = None) -> Dict:
+        """
+        Capture desktop context without blocking the event loop.
+
+        The screen grab and window query run concurrently; results are
+        cached under the same TTL as the synchronous path.
+
+        Args:
+            region: Optional region to capture
+
+        Returns:
+            A dictionary containing the captured context
+        """
+        now = time.monotonic()
+        if (region is None and self.last_capture is not None
+                and now - self._last_capture_monotonic < self.CAPTURE_TTL):
+            return self.last_capture
+
+        logger.info("Capturing desktop context (async), region: %s", region)
+
+        raw, active_window = await asyncio.gather(
+            self._grab_screen(region),
+            self._get_active_window_async(),
+        )
+
+        frame_hash = self._frame_hash(raw)
+        if (region is None and self.last_capture is not None
+                and frame_hash == self._last_frame_hash):
+            self.last_capture["timestamp"] = time.time()
+            self.last_capture_time = self.last_capture["timestamp"]
+            self._last_capture_monotonic = now
+            return self.last_capture
+
+        screenshot = Screenshot(raw)
 
-        # Create a placeholder context
         context = {
             "timestamp": time.time(),
-            "screenshot": "base64_encoded_image_data_would_go_here",
-            "active_window": self._get_active_window(),
+            "screenshot": screenshot,
+            "active_window": active_window,
             "visible_elements": self._get_visible_elements(),
             "region": region
         }
+        self._refresh_element_index(context["visible_elements"])
 
         self.last_capture = context
         self.last_capture_time = context["timestamp"]
+        self._last_capture_monotonic = now
+        self._last_frame_hash = frame_hash
 
         return context
 
+    async def _grab_screen(self, region: Optional[Dict] = None) -> bytes:
+        """
+        Grab the screen contents.
+
+        A real implementation would run the platform screenshot API in a
+        worker via asyncio.to_thread; the stub returns placeholder data.
+
+        Args:
+            region: Optional region to capture
+
+        Returns:
+            Raw image bytes
+        """
+        return _STUB_SCREENSHOT_RAW
+
+    async def _get_active_window_async(self) -> Dict:
+        """Async wrapper over the active-window query."""
+        return self._get_active_window()
+
     def _get_active_window(self) -> Dict:
         """
         Get information about the active window.
@@ -73,30 +297,17 @@ class DesktopContext:
             "rect": {"left": 0, "top": 0, "right": 1920, "bottom": 1080}
         }
 
-    def _get_visible_elements(self) -> List[Dict]:
+    def _get_visible_elements(self) -> Tuple[UIElement, ...]:
         """
         Get information about visible UI elements.
 
         Returns:
-            A list of dictionaries with UI element information
+            A tuple of UIElement records
         """
         # This is a placeholder for the actual element detection
         # In a real implementation, this would use UI Automation or similar
 
-        return [
-            {
-                "type": "button",
-                "text": "OK",
-                "rect": {"left": 100, "top": 200, "right": 200, "bottom": 250},
-                "id": "ok-button"
-            },
-            {
-                "type": "textbox",
-                "text": "",
-                "rect": {"left": 100, "top": 100, "right": 500, "bottom": 150},
-                "id": "input-field"
-            }
-        ]
+        return _STUB_ELEMENTS
 
     def perform_action(self, action: Dict[str, Any]) -> bool:
         """
@@ -108,22 +319,18 @@ class DesktopContext:
         Returns:
             True if the action was successful, False otherwise
         """
-        logger.info(f"Performing desktop action: {action}")
+        logger.info("Performing desktop action: %s", action)
 
         # This is a placeholder for the actual action execution
         # In a real implementation, this would use platform-specific APIs
 
-        action_type = action.get("type")
-
-        if action_type == "click":
-            return self._perform_click(action)
-        elif action_type == "type":
-            return self._perform_type(action)
-        elif action_type == "key":
-            return self._perform_key(action)
-        else:
-            logger.warning(f"Unknown action type: {action_type}")
+        # One hashed lookup in the class-level table instead of a string
+        # comparison per supported action type
+        handler = self._DISPATCH.get(action.get("type"))
+        if handler is None:
+            logger.warning("Unknown action type: %s", action.get("type"))
             return False
+        return handler(self, action)
 
     def _perform_click(self, action: Dict[str, Any]) -> bool:
         """
@@ -142,12 +349,16 @@ class DesktopContext:
         position = action.get("position")
 
         if target:
-            logger.info(f"Clicking on target: {target}")
+            logger.info("Clicking on target: %s", target)
             # Find and click on the target element
             return True
         elif position:
-            logger.info(f"Clicking at position: {position}")
-            # Click at the specified position
+            logger.info("Clicking at position: %s", position)
+            # Resolve the element under the cursor via the vectorized
+            # hit test; a real implementation would click it
+            element = self.find_element_at(position.get("x", 0), position.get("y", 0))
+            if element is not None:
+                logger.info("Position hits element: %s", element.id)
             return True
         else:
             logger.warning("Click action missing target or position")
@@ -174,11 +385,11 @@ class DesktopContext:
             return False
 
         if target:
-            logger.info(f"Typing '{text}' in target: {target}")
+            logger.info("Typing '%s' in target: %s", text, target)
             # Find the target element and type the text
             return True
         else:
-            logger.info(f"Typing '{text}' in active element")
+            logger.info("Typing '%s' in active element", text)
             # Type in the currently active element
             return True
 
@@ -201,6 +412,15 @@ class DesktopContext:
             logger.warning("Key action missing key")
             return False
 
-        logger.info(f"Pressing key: {key}")
+        logger.info("Pressing key: %s", key)
         # Press the specified key
         return True
+
+
+# Action dispatch table, built once after the class body so entries bind
+# the plain functions (called with self explicitly)
+DesktopContext._DISPATCH = {
+    "click": DesktopContext._perform_click,
+    "type": DesktopContext._perform_type,
+    "key": DesktopContext._perform_key,
+}
@@ -2,184 +2,246 @@
 Main entry point for the exo Multi-Agent Framework
 """
 
-import argparse
+import json
 import logging
 import os
+import signal
 import sys
 import time
 import threading
+from functools import lru_cache
+from types import SimpleNamespace
+
+_USAGE = """usage: python -m exo.main [options]
+
+exo Multi-Agent Framework
+
+options:
+  -h, --help            Show this help message and exit
+  --version             Show version number and exit
+  --config PATH         Path to configuration file
+  --no-ui               Run without UI
+  --no-browser          Don't open browser automatically
+  --host HOST           Host to bind the web server to (default: localhost)
+  --port PORT           Port for the web server (default: 8080)
+  --websocket-port PORT Port for the WebSocket server (default: 8765)
+  --skip-onboarding     Skip the onboarding process
+  --add-mcp-server      Add a new MCP server
+  --add-local-mcp       Install and add a local MCP server
+  --onboard             Run the onboarding process
+  --voice               Enable voice assistant
+  --wake-word WORD      Wake word for voice assistant (default: exo)
+  --simulate-voice      Use simulated voice commands (for testing)
+  --direct-mic          Use direct microphone access instead of web-based voice input
+  --app-mode            Launch browser in app mode (standalone window)
+  --electron            Use Electron UI instead of web UI
+  --no-electron         Disable Electron UI even if available
+"""
 
-from exo.ui.web_server import WebServer
-from exo.ui.electron_ui import ElectronUI
-
-from exo.core.system import ExoSystem
-from exo.core.onboarding import Onboarding
-from exo.core.service_registry import ServiceRegistry, ServiceNames, register_service, get_service
-from exo.agents.software_engineer import SoftwareEngineerAgent
-from exo.agents.mcp_server import MCPServerAgent
-from exo.agents.voice_assistant import VoiceAssistantAgent
-from exo.agents.mcp_manager import MCPManager
-from exo.agents.llm_manager import LLMManager
-from exo.core.mcp_server_manager import mcp_server_manager
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout)
-    ]
+# Answer trivial invocations before importing any further exo module,
+# so --help/--version never pay for the framework's import graph.
+# EXO_FULL_HELP=1 skips the shortcut and routes --help through argparse.
+if __name__ == "__main__" and os.environ.get("EXO_FULL_HELP") != "1":
+    _early = [a for a in sys.argv[1:] if a in ("-h", "--help", "--version")]
+    if _early:
+        if "--version" in _early:
+            from exo import __version__
+            print(f"exo {__version__}")
+        else:
+            print(_USAGE, end="")
+        sys.exit(0)
+
+from exo.core.service_registry import (
+    ServiceNames,
+    register_service,
+    register_service_factory,
+    get_service,
 )
 
+# Heavy modules (web/Electron UI, agents, managers) are imported inside
+# the code paths that actually use them, so trivial invocations such as
+# --help only pay for argparse and the registry
+
+# Configure logging, unless an embedding application already has
+if not logging.getLogger().handlers:
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.StreamHandler(sys.stdout)
+        ]
+    )
+
 logger = logging.getLogger(__name__)
 
-def register_domain_agents(exo_system):
-    """
-    Register the initial domain agents with the system.
+# Message-type and role constants, explicitly interned: comparisons and
+# dict probes against them hit the pointer-equality fast path instead of
+# comparing string contents
+_T_MESSAGE = sys.intern("message")
+_T_CHAT = sys.intern("chat_message")
+_T_VOICE = sys.intern("voice_message")
+_ROLE_SYSTEM = sys.intern("system")
+_ROLE_USER = sys.intern("user")
+_ROLE_ASSISTANT = sys.intern("assistant")
+
+# System prompt for the chat handler, interned once at import instead of
+# being rebuilt (string plus wrapper dict) for every incoming message
+SYSTEM_PROMPT = "You are a helpful assistant. Provide accurate and concise information."
+_SYSTEM_MESSAGE = {"role": _ROLE_SYSTEM, "content": SYSTEM_PROMPT}
+
+# Service keys hoisted to module scope: the chat handler resolves a
+# local constant instead of a ServiceNames attribute per message, and
+# interning lets dict probes compare cached pointers
+_LLM_KEY = ServiceNames.LLM_MANAGER
+_WEB_SERVER_KEY = sys.intern("web_server")
+_VOICE_KEY = sys.intern("voice_assistant")
+
+
+def _chat_template(content):
+    """Prebuilt chat_message envelope; timestamp added at send time."""
+    return {
+        "type": _T_CHAT,
+        "data": {"role": _ROLE_ASSISTANT, "content": content}
+    }
+
+
+# Constant error envelopes built once at import; each send only stamps
+# a fresh timestamp onto a shallow copy instead of re-allocating the
+# literals
+_CONN_ERROR_MSG = _chat_template(
+    "I'm sorry, I'm having trouble connecting to my language model. Please check your API keys and internet connection."
+)
+_PROCESSING_ERROR_MSG = _chat_template(
+    "I'm sorry, an error occurred while processing your message."
+)
+_LLM_UNAVAILABLE_MSG = _chat_template(
+    "I'm sorry, the language model service is not available. Please check your configuration."
+)
 
-    Args:
-        exo_system: The ExoSystem instance
+_WELCOME_MSG = {
+    "role": _ROLE_ASSISTANT,
+    "content": "Welcome to exo! I'm your personal assistant. How can I help you today?"
+}
+
+# The welcome envelope's JSON form is constant apart from the
+# timestamp; encode it once at import and substitute the timestamp at
+# send time, skipping json.dumps on the startup path
+_WELCOME_JSON_TEMPLATE = json.dumps(
+    {"type": _T_CHAT, "data": {**_WELCOME_MSG, "timestamp": "__TS__"}}
+).replace('"__TS__"', "__TS__")
+
+
+def _stamped(template):
+    """Copy of a prebuilt envelope carrying the current timestamp."""
+    return {**template, "data": {**template["data"], "timestamp": time.time()}}
+
+# CLI options: flag name -> (default, is_boolean). Boolean options are
+# store_true; the rest take a value as "--key value" or "--key=value".
+_CLI_OPTIONS = {
+    "config": (None, False),
+    "no_ui": (False, True),
+    "no_browser": (False, True),
+    "host": ("localhost", False),
+    "port": (8080, False),
+    "websocket_port": (8765, False),
+    "skip_onboarding": (False, True),
+    "add_mcp_server": (False, True),
+    "add_local_mcp": (False, True),
+    "onboard": (False, True),
+    "voice": (False, True),
+    "wake_word": ("exo", False),
+    "simulate_voice": (False, True),
+    "direct_mic": (False, True),
+    "app_mode": (False, True),
+    "electron": (False, True),
+    "no_electron": (False, True),
+}
+
+
+@lru_cache(maxsize=1)
+def _config_path():
+    """Path to the user's config file, built (and expanduser'd) once."""
+    return os.path.join(os.path.expanduser("~"), ".exo", "config.json")
+
+
+def _parse_args(argv=None):
     """
-    logger.info("Registering domain agents")
+    Parse command-line arguments with a single pass over argv.
 
-    # Register Software Engineer Agent
-    exo_system.register_domain_agent(
-        agent_class=SoftwareEngineerAgent,
-        domain="software_engineering",
-        capabilities=[]
-    )
+    A hand-rolled parser keeps trivial invocations (--help in
+    particular) from paying argparse's construction of the full option
+    table. Set EXO_FULL_HELP=1 to route through argparse instead.
 
-    # Register MCP Server Agent
-    exo_system.register_domain_agent(
-        agent_class=MCPServerAgent,
-        domain="mcp_server",
-        capabilities=[]
-    )
+    Args:
+        argv: Argument list (defaults to sys.argv[1:])
 
-    logger.info("Domain agents registered")
+    Returns:
+        SimpleNamespace with one attribute per option
+    """
+    if os.environ.get("EXO_FULL_HELP") == "1":
+        return _parse_args_argparse(argv)
+
+    if argv is None:
+        argv = sys.argv[1:]
+
+    values = {name: default for name, (default, _flag) in _CLI_OPTIONS.items()}
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg in ("-h", "--help"):
+            print(_USAGE, end="")
+            sys.exit(0)
+
+        if arg == "--version":
+            from exo import __version__
+            print(f"exo {__version__}")
+            sys.exit(0)
+
+        if not arg.startswith("--"):
+            print(f"error: unrecognized argument: {arg}", file=sys.stderr)
+            sys.exit(2)
+
+        key, sep, value = arg[2:].partition("=")
+        name = key.replace("-", "_")
+        option = _CLI_OPTIONS.get(name)
+        if option is None:
+            print(f"error: unrecognized argument: {arg}", file=sys.stderr)
+            sys.exit(2)
+
+        default, is_flag = option
+        if is_flag:
+            if sep:
+                print(f"error: --{key} takes no value", file=sys.stderr)
+                sys.exit(2)
+            values[name] = True
+        else:
+            if not sep:
+                i += 1
+                if i >= len(argv):
+                    print(f"error: {arg} expects a value", file=sys.stderr)
+                    sys.exit(2)
+                value = argv[i]
+            if isinstance(default, int):
+                try:
+                    value = int(value)
+                except ValueError:
+                    print(f"error: --{key} expects an integer, got {value!r}",
+                          file=sys.stderr)
+                    sys.exit(2)
+            values[name] = value
+        i += 1
 
-def handle_ui_message(message):
-    """Handle a message from the UI."""
-    try:
-        logger.info(f"Handling UI message: {message}")
+    return SimpleNamespace(**values)
 
-        # Validate message format
-        if not isinstance(message, dict):
-            logger.error(f"Invalid message format: {message}")
-            return
 
-        # Extract message data
-        message_type = message.get("type")
-        if not message_type:
-            logger.error(f"Message missing 'type': {message}")
-            return
+def _parse_args_argparse(argv=None):
+    """Full argparse parser, kept for rich help and error output."""
+    import argparse
 
-        if message_type == "message":
-            # Handle chat message
-            try:
-                message_data = message.get("data", {})
-                if not message_data:
-                    logger.error(f"Message missing 'data': {message}")
-                    return
-
-                content = message_data.get("content", "")
-                if not content:
-                    logger.warning(f"Message missing 'content': {message}")
-                    # Continue processing, as empty messages are technically valid
-
-                # Process the message through the LLM
-                logger.info(f"Processing message: {content}")
-
-                # Get the LLM manager from the service registry
-                llm_manager = get_service(ServiceNames.LLM_MANAGER)
-                if not llm_manager:
-                    logger.error("LLM manager service not available")
-
-                # Get the web server from the service registry
-                web_server = get_service("web_server")
-                if not web_server:
-                    logger.error("Web server service not available")
-                    return
-
-                if llm_manager:
-                    try:
-                        # Create a simple system prompt
-                        system_prompt = "You are a helpful assistant. Provide accurate and concise information."
-
-                        # Create a messages array for the chat API
-                        messages = [
-                            {"role": "system", "content": system_prompt},
-                            {"role": "user", "content": content}
-                        ]
-
-                        # Call the LLM
-                        success, response = llm_manager.chat(messages)
-
-                        if success:
-                            # Send the response back to the UI
-                            web_server.send_message({
-                                "type": "chat_message",
-                                "data": {
-                                    "role": "assistant",
-                                    "content": response,
-                                    "timestamp": time.time()
-                                }
-                            })
-                        else:
-                            # Send an error message
-                            logger.error(f"LLM chat failed: {response}")
-                            web_server.send_message({
-                                "type": "chat_message",
-                                "data": {
-                                    "role": "assistant",
-                                    "content": "I'm sorry, I'm having trouble connecting to my language model. Please check your API keys and internet connection.",
-                                    "timestamp": time.time()
-                                }
-                            })
-                    except Exception as e:
-                        logger.error(f"Error processing message with LLM: {e}")
-                        web_server.send_message({
-                            "type": "chat_message",
-                            "data": {
-                                "role": "assistant",
-                                "content": "I'm sorry, an error occurred while processing your message.",
-                                "timestamp": time.time()
-                            }
-                        })
-                else:
-                    # Send an error message
-                    web_server.send_message({
-                        "type": "chat_message",
-                        "data": {
-                            "role": "assistant",
-                            "content": "I'm sorry, the language model service is not available. Please check your configuration.",
-                            "timestamp": time.time()
-                        }
-                    })
-            except Exception as e:
-                logger.error(f"Error handling chat message: {e}")
-                # Try to send an error message if possible
-                try:
-                    web_server = get_service("web_server")
-                    if web_server:
-                        web_server.send_message({
-                            "type": "chat_message",
-                            "data": {
-                                "role": "assistant",
-                                "content": "I'm sorry, an error occurred while processing your message.",
-                                "timestamp": time.time()
-                            }
-                        })
-                except Exception as inner_e:
-                    logger.error(f"Failed to send error message: {inner_e}")
-        else:
-            logger.warning(f"Unhandled message type: {message_type}")
-    except Exception as e:
-        logger.error(f"Unhandled exception in handle_ui_message: {e}")
+    from exo import __version__
 
-def main():
-    """Main entry point for the exo system."""
     parser = argparse.ArgumentParser(description="exo Multi-Agent Framework")
+    parser.add_argument("--version", action="version", version=f"exo {__version__}")
     parser.add_argument("--config", help="Path to configuration file")
     parser.add_argument("--no-ui", action="store_true", help="Run without UI")
     parser.add_argument("--no-browser", action="store_true", help="Don't open browser automatically")
@@ -197,20 +259,280 @@ def main():
     parser.add_argument("--app-mode", action="store_true", help="Launch browser in app mode (standalone window)")
     parser.add_argument("--electron", action="store_true", help="Use Electron UI instead of web UI")
     parser.add_argument("--no-electron", action="store_true", help="Disable Electron UI even if available")
-    args = parser.parse_args()
+    return parser.parse_args(argv)
+
+
+# Startup status published through the ServiceRegistry while the
+# background probes run; UI handlers that need an initialized model
+# consult it instead of blocking startup on network I/O
+INIT_STATUS = SimpleNamespace(
+    state="pending",
+    llm_valid=None,
+    mcp_valid=None,
+    ready=threading.Event(),
+)
+
+
+def _background_init(mcp_manager):
+    """
+    Run the startup work that touches the network off the critical path.
+
+    Local MCP server startup and the LLM/MCP connection probes each
+    perform network I/O; running them here lets the UI come up and paint
+    its welcome message while they proceed. INIT_STATUS flips from
+    "pending" to "ready" (and its Event is set) when all are done.
+
+    Args:
+        mcp_manager: The MCPManager instance to validate
+    """
+    try:
+        from exo.core.mcp_server_manager import mcp_server_manager
+
+        logger.info("Initializing MCP server manager")
+        mcp_server_manager.initialize_servers()
+        mcp_server_manager.start_default_servers()
+
+        # Resolves the lazily registered LLMManager factory; the
+        # construction cost lands here, off the startup critical path,
+        # and the first chat message reuses the cached instance
+        llm_manager = get_service(ServiceNames.LLM_MANAGER)
+        INIT_STATUS.llm_valid = llm_manager.validate_connection()
+        if not INIT_STATUS.llm_valid:
+            logger.warning("LLM connection validation failed")
+
+        INIT_STATUS.mcp_valid = mcp_manager.validate_server()
+        if not INIT_STATUS.mcp_valid:
+            logger.warning("MCP server connection validation failed")
+    except Exception as e:
+        logger.error("Background initialization failed: %s", e)
+    finally:
+        INIT_STATUS.state = "ready"
+        INIT_STATUS.ready.set()
+
+
+def _run_init_tree(initializers, max_workers=4):
+    """
+    Run startup initializers concurrently, honoring dependencies.
+
+    Each entry is a (name, deps, func) tuple; func is called with no
+    arguments once every initializer named in deps has finished.
+    Independent initializers run in parallel, so startup cost
+    approaches the slowest dependency chain rather than the sum of all
+    constructors.
+
+    Args:
+        initializers: Iterable of (name, deps, callable) tuples
+        max_workers: Size of the thread pool running the initializers
+
+    Returns:
+        Dict mapping each name to its initializer's return value
+    """
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+    results = {}
+    waiting = {name: (frozenset(deps), func) for name, deps, func in initializers}
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        running = {}
+        while waiting or running:
+            ready = [name for name, (deps, _func) in waiting.items()
+                     if deps <= results.keys()]
+            for name in ready:
+                _deps, func = waiting.pop(name)
+                running[pool.submit(func)] = name
+            if not running:
+                raise ValueError(
+                    "Initializer dependency cycle: %s" % ", ".join(sorted(waiting))
+                )
+            done, _pending = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                results[running.pop(future)] = future.result()
+    return results
+
+
+# Domain agents registered at startup: (module, class, domain).
+# Modules are imported lazily at registration time, so only the agents
+# listed here are ever loaded.
+_DOMAIN_AGENTS = (
+    (".software_engineer", "SoftwareEngineerAgent", "software_engineering"),
+    (".mcp_server", "MCPServerAgent", "mcp_server"),
+)
+
+
+def register_domain_agents(exo_system):
+    """
+    Register the initial domain agents with the system.
+
+    Args:
+        exo_system: The ExoSystem instance
+    """
+    logger.info("Registering domain agents")
+
+    from importlib import import_module
+
+    for module_name, class_name, domain in _DOMAIN_AGENTS:
+        agent_class = getattr(import_module(module_name, "exo.agents"), class_name)
+        exo_system.register_domain_agent(
+            agent_class=agent_class,
+            domain=domain,
+            capabilities=()
+        )
+
+    logger.info("Domain agents registered")
+
+def _handle_chat_message(message):
+    """Handle a chat message from the UI."""
+    message_data = message.get("data", {})
+    if not message_data:
+        logger.error("Message missing 'data': %s", message)
+        return
+
+    content = message_data.get("content", "")
+    if not content:
+        logger.warning("Message missing 'content': %s", message)
+        # Continue processing, as empty messages are technically valid
+
+    # Process the message through the LLM
+    logger.info("Processing message: %s", content)
+
+    # Get the LLM manager from the service registry
+    llm_manager = get_service(_LLM_KEY)
+    if not llm_manager:
+        logger.error("LLM manager service not available")
+
+    # Get the web server from the service registry
+    web_server = get_service(_WEB_SERVER_KEY)
+    if not web_server:
+        logger.error("Web server service not available")
+        return
+
+    if not llm_manager:
+        web_server.send_message(_stamped(_LLM_UNAVAILABLE_MSG))
+        return
+
+    try:
+        # Background probes may still be running right after startup;
+        # wait briefly for them rather than failing the first message
+        if INIT_STATUS.state == "pending":
+            web_server.set_dot_state("thinking")
+            INIT_STATUS.ready.wait(timeout=15.0)
+
+        # Create a messages array for the chat API; the system message
+        # is the shared module constant
+        messages = [
+            _SYSTEM_MESSAGE,
+            {"role": _ROLE_USER, "content": content}
+        ]
+
+        # Call the LLM
+        success, response = llm_manager.chat(messages)
+
+        if success:
+            # Send the response back to the UI
+            web_server.send_message({
+                "type": _T_CHAT,
+                "data": {
+                    "role": _ROLE_ASSISTANT,
+                    "content": response,
+                    "timestamp": time.time()
+                }
+            })
+        else:
+            # Send an error message
+            logger.error("LLM chat failed: %s", response)
+            web_server.send_message(_stamped(_CONN_ERROR_MSG))
+    except Exception as e:
+        logger.error("Error processing message with LLM: %s", e)
+        web_server.send_message(_stamped(_PROCESSING_ERROR_MSG))
+
+
+def _log_unhandled(message):
+    """Fallback for message types with no entry in _HANDLERS."""
+    logger.warning("Unhandled message type: %s", message.get("type"))
+
+
+# Message-type dispatch table: one dict probe replaces the if/elif
+# chain, and each handler owns its single try/except site
+_HANDLERS = {
+    _T_MESSAGE: _handle_chat_message,
+}
+
+
+def handle_ui_message(message):
+    """Handle a message from the UI by dispatching on its type."""
+    try:
+        # The full payload can be large; only stringify it when DEBUG
+        # output is actually enabled
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Handling UI message: %s", message)
+
+        # Validate message format
+        if not isinstance(message, dict):
+            logger.error("Invalid message format: %s", message)
+            return
+
+        message_type = message.get("type")
+        if not message_type:
+            logger.error("Message missing 'type': %s", message)
+            return
+
+        handler = _HANDLERS.get(message_type)
+        (handler or _log_unhandled)(message)
+    except Exception as e:
+        logger.error("Unhandled exception in handle_ui_message: %s", e)
+
+def _start_web_server(args, voice_assistant_ref, open_browser, app_mode=False):
+    """
+    Construct, register, and start the web server.
+
+    Shared by the Electron, Electron-fallback, and plain web UI paths
+    so handler registration and service bookkeeping live in one place.
+
+    Args:
+        args: Parsed command-line arguments
+        voice_assistant_ref: Started voice assistant instance, or None
+        open_browser: Whether to open a browser on start
+        app_mode: Launch the browser in standalone app mode
+
+    Returns:
+        The started WebServer instance
+    """
+    from exo.ui.web_server import WebServer
+
+    logger.info("Starting web server on %s:%s with WebSocket on port %s", args.host, args.port, args.websocket_port)
+    web_server = WebServer(host=args.host, port=args.port,
+                           websocket_port=args.websocket_port, app_mode=app_mode)
+    web_server.register_message_handler(_T_MESSAGE, handle_ui_message)
+
+    # Register the web server as a service
+    register_service(_WEB_SERVER_KEY, web_server)
+
+    # Register voice message handler if voice assistant is enabled
+    if voice_assistant_ref:
+        logger.info("Registering voice message handler")
+        web_server.register_message_handler(_T_VOICE, voice_assistant_ref.process_voice_message)
+
+    web_server.start(open_browser=open_browser)
+    return web_server
+
+
+def main():
+    """Main entry point for the exo system."""
+    args = _parse_args()
 
     logger.info("Starting exo Multi-Agent Framework")
 
+    # Heavy imports happen only after argument parsing succeeds
+    from exo.core.system import ExoSystem
+    from exo.core.onboarding import Onboarding
+    from exo.agents.mcp_manager import MCPManager
+    from exo.agents.llm_manager import LLMManager
+
     # Initialize onboarding and register it as a service
     onboarding = Onboarding()
     register_service(ServiceNames.ONBOARDING, onboarding)
 
-    # Initialize LLM manager and register it as a service
-    llm_manager = LLMManager(onboarding)
-    register_service(ServiceNames.LLM_MANAGER, llm_manager)
-
     # Run onboarding process if needed
-    config_exists = os.path.exists(os.path.join(os.path.expanduser("~"), ".exo", "config.json"))
+    config_exists = os.path.exists(_config_path())
     if args.onboard:
         logger.info("Running onboarding process (manual)")
         onboarding.run_onboarding(interactive=True, force=True)
@@ -222,16 +544,36 @@ def main():
         onboarding.export_env_vars()
         logger.info("Configuration loaded from existing file")
 
-    # Initialize LLM and MCP managers and register them as services
-    llm_manager = LLMManager(onboarding)
-    register_service(ServiceNames.LLM_MANAGER, llm_manager)
-
-    mcp_manager = MCPManager(onboarding)
-    register_service(ServiceNames.MCP_MANAGER, mcp_manager)
-
-    # Initialize and start local MCP servers
-    logger.info("Initializing MCP server manager")
-    mcp_server_manager.initialize_servers()
+    # Export saved configuration to environment variables once up front;
+    # later config saves mark the env stale and re-sync lazily
+    from exo.core.configuration import ConfigurationService
+    ConfigurationService.sync_env_if_dirty()
+
+    # Register the LLM manager lazily: the factory runs on the first
+    # get_service() call for it (the background connection probe, or
+    # the first chat message), keeping SDK construction and credential
+    # reads off the startup critical path entirely
+    register_service_factory(ServiceNames.LLM_MANAGER, lambda: LLMManager(onboarding))
+
+    # Build the remaining services concurrently: the MCP manager needs
+    # onboarding (already built), the system core needs nothing. Each
+    # initializer registers its service as soon as it resolves.
+    def _init_mcp():
+        manager = MCPManager(onboarding)
+        register_service(ServiceNames.MCP_MANAGER, manager)
+        return manager
+
+    def _init_system():
+        system = ExoSystem()
+        register_service(ServiceNames.SYSTEM, system)
+        return system
+
+    services = _run_init_tree([
+        ("mcp_manager", (), _init_mcp),
+        ("system", (), _init_system),
+    ])
+    mcp_manager = services["mcp_manager"]
+    exo_system = services["system"]
 
     # Add MCP server if requested
     if args.add_mcp_server or args.add_local_mcp:
@@ -242,33 +584,37 @@ def main():
         else:
             mcp_manager.onboard_new_server(local=False)
 
-    # Validate connections
-    llm_valid = llm_manager.validate_connection()
-    if not llm_valid:
-        logger.warning("LLM connection validation failed")
-
-    mcp_valid = mcp_manager.validate_server()
-    if not mcp_valid:
-        logger.warning("MCP server connection validation failed")
-
-    # Initialize the system and register it as a service
-    exo_system = ExoSystem()
-    register_service(ServiceNames.SYSTEM, exo_system)
-
-    # Initialize voice assistant if requested
+    # Start local MCP servers and validate connections in the
+    # background: startup is then bounded by the fastest path through
+    # main() rather than the sum of the network probes
+    register_service("init_status", INIT_STATUS)
+    threading.Thread(
+        target=_background_init,
+        args=(mcp_manager,),
+        daemon=True,
+        name="exo-background-init",
+    ).start()
+
+    # Initialize voice assistant if requested; the started instance is
+    # kept in a local so the UI branches below don't re-query the
+    # service registry for it
+    voice_assistant_ref = None
     if args.voice:
-        logger.info(f"Initializing voice assistant with wake word: {args.wake_word}")
+        from exo.agents.voice_assistant import VoiceAssistantAgent
+
+        logger.info("Initializing voice assistant with wake word: %s", args.wake_word)
         voice_assistant = VoiceAssistantAgent(
             wake_word=args.wake_word,
             use_simulation=args.simulate_voice,
             prefer_web_input=not args.direct_mic
         )
-        register_service("voice_assistant", voice_assistant)
+        register_service(_VOICE_KEY, voice_assistant)
 
         # Start the voice assistant
         success = voice_assistant.start()
         if success:
             logger.info("Voice assistant started successfully")
+            voice_assistant_ref = voice_assistant
         else:
             logger.warning("Failed to start voice assistant")
 
@@ -280,92 +626,57 @@ def main():
     electron_ui = None
 
     if not args.no_ui:
+        from exo.ui.electron_ui import ElectronUI
+
         # Check if Electron UI should be used
         use_electron = args.electron
 
         if not args.no_electron and not use_electron:
-            # Check if Electron UI is available
+            # Probe availability without constructing the UI object
             try:
-                electron_ui = ElectronUI(host=args.host, port=args.port, websocket_port=args.websocket_port)
-                if electron_ui.is_available():
+                if ElectronUI.is_available():
                     use_electron = True
                     logger.info("Electron UI is available")
                 else:
                     logger.info("Electron UI is not available, falling back to web UI")
             except Exception as e:
-                logger.warning(f"Error checking Electron UI availability: {e}")
+                logger.warning("Error checking Electron UI availability: %s", e)
                 logger.info("Falling back to web UI")
 
         # Start the appropriate UI
         if use_electron:
             try:
                 logger.info("Starting Electron UI")
-                if electron_ui is None:
-                    electron_ui = ElectronUI(host=args.host, port=args.port, websocket_port=args.websocket_port)
-
-                # Always start the web server for the Electron UI to connect to
-                logger.info(f"Starting web server on {args.host}:{args.port} with WebSocket on port {args.websocket_port}")
-                web_server = WebServer(host=args.host, port=args.port, websocket_port=args.websocket_port)
-                web_server.register_message_handler("message", handle_ui_message)
-
-                # Register the web server as a service
-                register_service("web_server", web_server)
-
-                # Register voice message handler if voice assistant is enabled
-                if args.voice and 'voice_assistant' in ServiceRegistry.services:
-                    voice_assistant = ServiceRegistry.services['voice_assistant']
-                    logger.info("Registering voice message handler")
-                    web_server.register_message_handler("voice_message", voice_assistant.process_voice_message)
+                electron_ui = ElectronUI(host=args.host, port=args.port, websocket_port=args.websocket_port)
 
-                # Start the web server without opening a browser
-                web_server.start(open_browser=False)
+                # Always start the web server for the Electron UI to
+                # connect to, without opening a browser
+                web_server = _start_web_server(args, voice_assistant_ref, open_browser=False)
 
                 # Start the Electron UI
                 electron_ui.start()
             except Exception as e:
-                logger.warning(f"Failed to start Electron UI: {e}")
+                logger.warning("Failed to start Electron UI: %s", e)
                 logger.info("Falling back to web UI")
                 electron_ui = None
 
                 # Try to start the web UI as a fallback
                 try:
-                    logger.info(f"Starting web server on {args.host}:{args.port} with WebSocket on port {args.websocket_port}")
-                    web_server = WebServer(host=args.host, port=args.port, websocket_port=args.websocket_port, app_mode=args.app_mode)
-                    web_server.register_message_handler("message", handle_ui_message)
-
-                    # Register the web server as a service
-                    register_service("web_server", web_server)
-
-                    # Register voice message handler if voice assistant is enabled
-                    if args.voice and 'voice_assistant' in ServiceRegistry.services:
-                        voice_assistant = ServiceRegistry.services['voice_assistant']
-                        logger.info("Registering voice message handler")
-                        web_server.register_message_handler("voice_message", voice_assistant.process_voice_message)
-
-                    web_server.start(open_browser=not args.no_browser)
+                    web_server = _start_web_server(args, voice_assistant_ref,
+                                                   open_browser=not args.no_browser,
+                                                   app_mode=args.app_mode)
                 except Exception as e:
-                    logger.warning(f"Failed to start web server: {e}")
+                    logger.warning("Failed to start web server: %s", e)
                     logger.info("Continuing without UI")
                     web_server = None
         else:
             # Start the web UI
             try:
-                logger.info(f"Starting web server on {args.host}:{args.port} with WebSocket on port {args.websocket_port}")
-                web_server = WebServer(host=args.host, port=args.port, websocket_port=args.websocket_port, app_mode=args.app_mode)
-                web_server.register_message_handler("message", handle_ui_message)
-
-                # Register the web server as a service
-                register_service("web_server", web_server)
-
-                # Register voice message handler if voice assistant is enabled
-                if args.voice and 'voice_assistant' in ServiceRegistry.services:
-                    voice_assistant = ServiceRegistry.services['voice_assistant']
-                    logger.info("Registering voice message handler")
-                    web_server.register_message_handler("voice_message", voice_assistant.process_voice_message)
-
-                web_server.start(open_browser=not args.no_browser)
+                web_server = _start_web_server(args, voice_assistant_ref,
+                                               open_browser=not args.no_browser,
+                                               app_mode=args.app_mode)
             except Exception as e:
-                logger.warning(f"Failed to start web server: {e}")
+                logger.warning("Failed to start web server: %s", e)
                 logger.info("Continuing without UI")
                 web_server = None
 
@@ -375,31 +686,53 @@ def main():
     # Send a welcome message to the UI
     if web_server:
         try:
-            welcome_message = {
-                "role": "assistant",
-                "content": "Welcome to exo! I'm your personal assistant. How can I help you today?",
-                "timestamp": time.time()
-            }
-            web_server.send_chat_message(welcome_message)
+            ts = time.time()
+            web_server.send_message_serialized(
+                {"type": _T_CHAT, "data": {**_WELCOME_MSG, "timestamp": ts}},
+                _WELCOME_JSON_TEMPLATE.replace("__TS__", repr(ts)),
+            )
             web_server.set_dot_state("idle")
         except Exception as e:
-            logger.warning(f"Failed to send welcome message: {e}")
+            logger.warning("Failed to send welcome message: %s", e)
 
+    # Block the main thread on an Event instead of a once-per-second
+    # sleep loop; SIGINT sets the event, so the process stays fully
+    # idle until shutdown
+    shutdown = threading.Event()
     try:
-        # Keep the main thread alive
-        while True:
-            time.sleep(1)
+        signal.signal(signal.SIGINT, lambda *_args: shutdown.set())
+        # SIGTERM too, so container orchestrators get a clean drain
+        # instead of escalating to SIGKILL
+        signal.signal(signal.SIGTERM, lambda *_args: shutdown.set())
+    except (ValueError, OSError):
+        # Signal delivery unavailable (non-main thread or platform
+        # quirk); KeyboardInterrupt still unblocks the wait below
+        pass
+    try:
+        shutdown.wait()
     except KeyboardInterrupt:
-        logger.info("Keyboard interrupt received, shutting down")
-        exo_system.stop()
-        if web_server:
-            web_server.stop()
-        if electron_ui:
-            electron_ui.stop()
-
-        # Stop all local MCP servers
-        logger.info("Stopping local MCP servers")
-        mcp_server_manager.stop_all_local_servers()
+        pass
+
+    logger.info("Shutdown signal received, shutting down")
+
+    # The stop() calls are independent of each other; fan them out so
+    # shutdown latency is the slowest drain, not the sum of all
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Imported here rather than with the other heavy imports: the
+    # manager module only loads on the paths that actually talk to it
+    # (the background init thread and this shutdown sequence)
+    from exo.core.mcp_server_manager import mcp_server_manager
+
+    logger.info("Stopping local MCP servers")
+    stops = [exo_system.stop, mcp_server_manager.stop_all_local_servers]
+    if web_server:
+        stops.append(web_server.stop)
+    if electron_ui:
+        stops.append(electron_ui.stop)
+    with ThreadPoolExecutor(max_workers=len(stops)) as pool:
+        for stop in stops:
+            pool.submit(stop)
 
     logger.info("exo system shutdown complete")
 
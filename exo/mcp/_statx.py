@@ -0,0 +1,117 @@
+"""
+ctypes binding for Linux statx(2).
+
+list_files only needs the type/size/mtime triple per directory entry;
+statx with AT_STATX_DONT_SYNC and a narrow field mask returns exactly
+that without forcing the filesystem to sync attributes, which is much
+cheaper than a full stat on cached metadata. The binding degrades to
+None (callers fall back to os.stat) on non-Linux platforms, old
+kernels, or libcs without the wrapper.
+"""
+
+import ctypes
+import errno
+import os
+
+AT_FDCWD = -100
+AT_STATX_DONT_SYNC = 0x4000
+
+STATX_TYPE = 0x0001
+STATX_MTIME = 0x0040
+STATX_SIZE = 0x0200
+
+_S_IFMT = 0o170000
+_S_IFDIR = 0o040000
+_S_IFREG = 0o100000
+
+_MASK = STATX_TYPE | STATX_SIZE | STATX_MTIME
+
+
+class _StatxTimestamp(ctypes.Structure):
+    _fields_ = [
+        ("tv_sec", ctypes.c_int64),
+        ("tv_nsec", ctypes.c_uint32),
+        ("_reserved", ctypes.c_int32),
+    ]
+
+
+class _Statx(ctypes.Structure):
+    # struct statx from linux/stat.h; the trailing spare array keeps
+    # the buffer at least as large as any kernel will write
+    _fields_ = [
+        ("stx_mask", ctypes.c_uint32),
+        ("stx_blksize", ctypes.c_uint32),
+        ("stx_attributes", ctypes.c_uint64),
+        ("stx_nlink", ctypes.c_uint32),
+        ("stx_uid", ctypes.c_uint32),
+        ("stx_gid", ctypes.c_uint32),
+        ("stx_mode", ctypes.c_uint16),
+        ("_spare0", ctypes.c_uint16),
+        ("stx_ino", ctypes.c_uint64),
+        ("stx_size", ctypes.c_uint64),
+        ("stx_blocks", ctypes.c_uint64),
+        ("stx_attributes_mask", ctypes.c_uint64),
+        ("stx_atime", _StatxTimestamp),
+        ("stx_btime", _StatxTimestamp),
+        ("stx_ctime", _StatxTimestamp),
+        ("stx_mtime", _StatxTimestamp),
+        ("stx_rdev_major", ctypes.c_uint32),
+        ("stx_rdev_minor", ctypes.c_uint32),
+        ("stx_dev_major", ctypes.c_uint32),
+        ("stx_dev_minor", ctypes.c_uint32),
+        ("stx_mnt_id", ctypes.c_uint64),
+        ("_spare1", ctypes.c_uint64 * 14),
+    ]
+
+
+try:
+    _libc = ctypes.CDLL(None, use_errno=True)
+    _statx = _libc.statx
+    _statx.argtypes = [
+        ctypes.c_int,
+        ctypes.c_char_p,
+        ctypes.c_int,
+        ctypes.c_uint,
+        ctypes.POINTER(_Statx),
+    ]
+    _statx.restype = ctypes.c_int
+except (OSError, AttributeError):
+    _statx = None
+
+# Availability decided once, on the first call that reaches the kernel
+# (ENOSYS/EINVAL means the syscall or flags are unsupported there)
+_usable = _statx is not None
+
+
+def statx_entry(path):
+    """
+    Type/size/mtime for a path via statx, or None when unavailable.
+
+    Args:
+        path: Filesystem path to query
+
+    Returns:
+        Tuple of (is_dir, is_file, size, mtime), or None if statx is
+        not usable on this platform or the call failed (callers should
+        fall back to os.stat)
+    """
+    global _usable
+    if not _usable:
+        return None
+
+    buf = _Statx()
+    rc = _statx(AT_FDCWD, os.fsencode(path), AT_STATX_DONT_SYNC, _MASK,
+                ctypes.byref(buf))
+    if rc != 0:
+        if ctypes.get_errno() in (errno.ENOSYS, errno.EINVAL):
+            # Kernel or libc too old: stop trying for the process
+            _usable = False
+        return None
+
+    mode = buf.stx_mode & _S_IFMT
+    return (
+        mode == _S_IFDIR,
+        mode == _S_IFREG,
+        buf.stx_size,
+        buf.stx_mtime.tv_sec + buf.stx_mtime.tv_nsec * 1e-9,
+    )
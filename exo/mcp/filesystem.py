@@ -2,13 +2,29 @@
 Filesystem MCP Server for file system access and operations.
 """
 
+# When run as the server (python -m exo.mcp.filesystem), monkey-patch
+# before the other imports so socket and file I/O yield cooperatively;
+# every endpoint here is I/O-bound, so greenlets let one worker keep
+# many filesystem calls in flight. Optional: without gevent the server
+# falls back to the threaded Werkzeug runner in main().
+if __name__ == "__main__":
+    try:
+        from gevent import monkey
+        monkey.patch_all()
+    except ImportError:
+        pass
+
 import argparse
 import json
 import logging
 import os
+import shutil
+import stat as stat_module
 import sys
+import time
 from typing import Dict, List, Any, Optional
-from flask import Flask, request, jsonify
+from exo.mcp import _statx
+from flask import Flask, Response, request, jsonify, send_file, stream_with_context
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +37,110 @@ logging.basicConfig(
 
 app = Flask(__name__)
 
+# Decode and encode JSON with orjson when it is installed (optional,
+# see requirements.txt): its C parser is severalfold faster than the
+# stdlib json module on the request bodies and listings served here
+try:
+    import orjson
+    from flask.json.provider import DefaultJSONProvider
+
+    class _OrjsonProvider(DefaultJSONProvider):
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = _OrjsonProvider(app)
+except ImportError:
+    pass
+
+# JSON bodies above this size are rejected outright instead of being
+# buffered and decoded; raw uploads to /write stream past this limit
+# and are deliberately not capped by it
+_MAX_JSON_BODY = 64 * 1024 * 1024
+
+# Chunk size for streamed file reads
+_READ_CHUNK_SIZE = 64 * 1024
+
+# Files below this size are read and jsonified in one shot; streaming
+# overhead only pays for itself above it
+_SMALL_FILE_LIMIT = 1 << 20
+
+# Path-metadata cache: clients that repeatedly probe the same tree
+# (IDE-style file browsers) otherwise re-pay three or four stat
+# syscalls per request. Entries are (expires, info) keyed by the raw
+# request path; missing paths are cached too, so repeated ENOENT
+# probes cost one dict hit instead of a syscall.
+_STAT_TTL = 1.0
+_STAT_CACHE_MAX = 4096
+_stat_cache = {}
+
+
+def _resolve_and_stat(path):
+    """
+    Resolve a request path and stat it, with a short TTL cache.
+
+    Args:
+        path: Path as given in the request
+
+    Returns:
+        Tuple of (abs_path, exists, is_dir, is_file, size, mtime);
+        size and mtime are None when the path does not exist.
+    """
+    now = time.monotonic()
+    cached = _stat_cache.get(path)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+
+    abs_path = path
+    if abs_path.startswith("~"):
+        abs_path = os.path.expanduser(abs_path)
+    abs_path = os.path.abspath(abs_path)
+
+    try:
+        st = os.stat(abs_path)
+    except OSError:
+        info = (abs_path, False, False, False, None, None)
+    else:
+        info = (
+            abs_path,
+            True,
+            stat_module.S_ISDIR(st.st_mode),
+            stat_module.S_ISREG(st.st_mode),
+            st.st_size,
+            st.st_mtime,
+        )
+
+    if len(_stat_cache) >= _STAT_CACHE_MAX:
+        _stat_cache.clear()
+    _stat_cache[path] = (now + _STAT_TTL, info)
+    return info
+
+
+def _invalidate_stat(path):
+    """Drop the cache entry for a path after a mutating operation."""
+    _stat_cache.pop(path, None)
+
+
+def _json_body():
+    """
+    Parse the JSON request body once, with a size guard.
+
+    get_json caches the parsed body on the request, so nothing is
+    decoded twice; oversized or malformed bodies come back as None so
+    a client cannot pin a worker with a huge payload.
+
+    Returns:
+        The decoded body as a dict, or None if it is missing, not
+        valid JSON, not a JSON object, or larger than _MAX_JSON_BODY.
+    """
+    length = request.content_length
+    if length is not None and length > _MAX_JSON_BODY:
+        return None
+    data = request.get_json(cache=True, silent=True)
+    return data if isinstance(data, dict) else None
+
 @app.route("/health", methods=["GET"])
 def health_check():
     """Health check endpoint."""
@@ -29,36 +149,43 @@ def health_check():
 @app.route("/list", methods=["POST"])
 def list_files():
     """List files in a directory."""
-    data = request.json
+    data = _json_body()
+    if data is None:
+        return jsonify({"error": "A JSON body is required"}), 400
     path = data.get("path", ".")
     
     try:
-        # Expand user directory if needed
-        if path.startswith("~"):
-            path = os.path.expanduser(path)
-        
-        # Get absolute path
-        path = os.path.abspath(path)
-        
-        # Check if path exists
-        if not os.path.exists(path):
+        # Resolve and probe through the shared stat cache
+        path, exists, is_dir, _is_file, _size, _mtime = _resolve_and_stat(path)
+
+        if not exists:
             return jsonify({"error": f"Path does not exist: {path}"}), 404
-        
-        # Check if path is a directory
-        if not os.path.isdir(path):
+
+        if not is_dir:
             return jsonify({"error": f"Path is not a directory: {path}"}), 400
-        
-        # List files and directories
+
+        # List files and directories in one scandir pass. Per entry,
+        # statx with AT_STATX_DONT_SYNC fetches just type/size/mtime
+        # without forcing attribute sync; where statx is unavailable
+        # the DirEntry path still makes only one full stat per entry.
         items = []
-        for item in os.listdir(path):
-            item_path = os.path.join(path, item)
-            item_type = "directory" if os.path.isdir(item_path) else "file"
-            items.append({
-                "name": item,
-                "type": item_type,
-                "size": os.path.getsize(item_path) if os.path.isfile(item_path) else None,
-                "modified": os.path.getmtime(item_path)
-            })
+        with os.scandir(path) as entries:
+            for entry in entries:
+                probed = _statx.statx_entry(entry.path)
+                if probed is not None:
+                    is_dir, is_file, size, mtime = probed
+                else:
+                    stat_result = entry.stat()
+                    is_dir = entry.is_dir()
+                    is_file = entry.is_file()
+                    size = stat_result.st_size
+                    mtime = stat_result.st_mtime
+                items.append({
+                    "name": entry.name,
+                    "type": "directory" if is_dir else "file",
+                    "size": size if is_file else None,
+                    "modified": mtime
+                })
         
         return jsonify({
             "path": path,
@@ -70,45 +197,151 @@ def list_files():
 
 @app.route("/read", methods=["POST"])
 def read_file():
-    """Read a file."""
-    data = request.json
+    """Read a file, streaming the body instead of buffering it."""
+    data = _json_body()
+    if data is None:
+        return jsonify({"error": "A JSON body is required"}), 400
     path = data.get("path")
-    
+    raw = (
+        data.get("raw")
+        or request.args.get("raw") == "1"
+        or request.accept_mimetypes.best_match(
+            ["application/json", "application/octet-stream"]
+        ) == "application/octet-stream"
+    )
+
     if not path:
         return jsonify({"error": "Path is required"}), 400
-    
+
+    try:
+        # Resolve and probe through the shared stat cache
+        path, exists, _is_dir, is_file, size, mtime = _resolve_and_stat(path)
+
+        if not exists:
+            return jsonify({"error": f"File does not exist: {path}"}), 404
+
+        if not is_file:
+            return jsonify({"error": f"Path is not a file: {path}"}), 400
+
+        # Raw mode (explicit flag or Accept: application/octet-stream):
+        # hand the file to Flask, whose wsgi.file_wrapper dispatches to
+        # os.sendfile where available, skipping the user-space copy
+        if raw:
+            return send_file(
+                path,
+                conditional=True,
+                etag=True,
+                last_modified=mtime,
+            )
+
+        # Small files: one read plus jsonify beats generator overhead
+        if size < _SMALL_FILE_LIMIT:
+            with open(path, "r") as f:
+                return jsonify({"path": path, "content": f.read()})
+
+        def generate():
+            # Stream the JSON body as header, escaped 64 KiB chunks,
+            # and closing tokens; peak memory stays at one chunk
+            # instead of 2-3x the file size
+            yield '{"path": %s, "content": "' % json.dumps(path)
+            with open(path, "r") as f:
+                while True:
+                    chunk = f.read(_READ_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    # json.dumps escapes the chunk; strip its quotes
+                    yield json.dumps(chunk)[1:-1]
+            yield '"}'
+
+        return Response(stream_with_context(generate()), mimetype="application/json")
+    except Exception as e:
+        logger.error(f"Error reading file: {e}")
+        return jsonify({"error": str(e)}), 500
+
+def _write_bytes(path, data):
+    """
+    Write data to path through the raw file descriptor.
+
+    One open/write/close sequence on the fd skips Python's buffered-I/O
+    layer and its intermediate copy; the loop covers partial writes.
+
+    Args:
+        path: Destination path
+        data: Bytes to write
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+
+def _write_stream(request_path):
+    """
+    Stream a binary request body straight to a file.
+
+    When Content-Length is known the blocks are reserved up front with
+    posix_fallocate, avoiding fragmentation retries, and copyfileobj
+    moves the body in 1 MiB buffers so peak memory stays flat no
+    matter how large the upload is.
+
+    Args:
+        request_path: Destination path from the query string
+    """
+    if not request_path:
+        return jsonify({"error": "Path is required"}), 400
+
+    path = request_path
     try:
         # Expand user directory if needed
         if path.startswith("~"):
             path = os.path.expanduser(path)
-        
+
         # Get absolute path
         path = os.path.abspath(path)
-        
-        # Check if path exists
-        if not os.path.exists(path):
-            return jsonify({"error": f"File does not exist: {path}"}), 404
-        
-        # Check if path is a file
-        if not os.path.isfile(path):
-            return jsonify({"error": f"Path is not a file: {path}"}), 400
-        
-        # Read file
-        with open(path, "r") as f:
-            content = f.read()
-        
+
+        # Create directory if it doesn't exist
+        directory = os.path.dirname(path)
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        with os.fdopen(fd, "wb") as f:
+            length = request.content_length
+            if length and hasattr(os, "posix_fallocate"):
+                try:
+                    os.posix_fallocate(fd, 0, length)
+                except OSError:
+                    # Filesystem without fallocate support
+                    pass
+            shutil.copyfileobj(request.stream, f, length=1 << 20)
+
+        # The write changed what a cached probe would report
+        _invalidate_stat(request_path)
+
         return jsonify({
             "path": path,
-            "content": content
+            "success": True
         })
     except Exception as e:
-        logger.error(f"Error reading file: {e}")
+        logger.error(f"Error writing file: {e}")
         return jsonify({"error": str(e)}), 500
 
+
 @app.route("/write", methods=["POST"])
 def write_file():
     """Write to a file."""
-    data = request.json
+    # Binary bodies stream straight to disk without a JSON round trip;
+    # the destination comes from the query string
+    if request.content_type == "application/octet-stream":
+        return _write_stream(request.args.get("path"))
+
+    data = _json_body()
+    if data is None:
+        return jsonify({"error": "A JSON body is required"}), 400
     path = data.get("path")
     content = data.get("content")
     
@@ -117,24 +350,28 @@ def write_file():
     
     if content is None:
         return jsonify({"error": "Content is required"}), 400
-    
+
+    request_path = path
     try:
         # Expand user directory if needed
         if path.startswith("~"):
             path = os.path.expanduser(path)
-        
+
         # Get absolute path
         path = os.path.abspath(path)
-        
+
         # Create directory if it doesn't exist
         directory = os.path.dirname(path)
         if not os.path.exists(directory):
             os.makedirs(directory)
-        
-        # Write file
-        with open(path, "w") as f:
-            f.write(content)
-        
+
+        # Write file: encode once and push the bytes straight through
+        # the fd rather than through a buffered text wrapper
+        _write_bytes(path, content.encode("utf-8"))
+
+        # The write changed what a cached probe would report
+        _invalidate_stat(request_path)
+
         return jsonify({
             "path": path,
             "success": True
@@ -146,35 +383,35 @@ def write_file():
 @app.route("/delete", methods=["POST"])
 def delete_file():
     """Delete a file or directory."""
-    data = request.json
+    data = _json_body()
+    if data is None:
+        return jsonify({"error": "A JSON body is required"}), 400
     path = data.get("path")
     recursive = data.get("recursive", False)
     
     if not path:
         return jsonify({"error": "Path is required"}), 400
-    
+
+    request_path = path
     try:
-        # Expand user directory if needed
-        if path.startswith("~"):
-            path = os.path.expanduser(path)
-        
-        # Get absolute path
-        path = os.path.abspath(path)
-        
-        # Check if path exists
-        if not os.path.exists(path):
+        # Resolve and probe through the shared stat cache
+        path, exists, is_dir, is_file, _size, _mtime = _resolve_and_stat(path)
+
+        if not exists:
             return jsonify({"error": f"Path does not exist: {path}"}), 404
-        
+
         # Delete file or directory
-        if os.path.isfile(path):
+        if is_file:
             os.remove(path)
-        elif os.path.isdir(path):
+        elif is_dir:
             if recursive:
-                import shutil
                 shutil.rmtree(path)
             else:
                 os.rmdir(path)
-        
+
+        # The path is gone; drop its cached probe
+        _invalidate_stat(request_path)
+
         return jsonify({
             "path": path,
             "success": True
@@ -191,7 +428,16 @@ def main():
     args = parser.parse_args()
     
     logger.info(f"Starting Filesystem MCP Server on {args.host}:{args.port}")
-    app.run(host=args.host, port=args.port)
+    try:
+        from gevent.pywsgi import WSGIServer
+    except ImportError:
+        # gevent unavailable: the threaded Werkzeug server still
+        # allows one request per thread rather than one at a time
+        logger.info("gevent not installed, serving with the threaded Werkzeug server")
+        app.run(host=args.host, port=args.port, threaded=True)
+        return
+
+    WSGIServer((args.host, args.port), app).serve_forever()
 
 if __name__ == "__main__":
     main()
@@ -10,6 +10,7 @@ import sys
 import json
 import logging
 import argparse
+import functools
 import subprocess
 import platform
 import shutil
@@ -53,19 +54,29 @@ PYTHON_DEPENDENCIES = [
     "python-dotenv>=0.15.0",
 ]
 
+@functools.lru_cache(maxsize=1)
 def get_platform_info():
-    """Get information about the current platform."""
+    """Get information about the current platform.
+
+    The result cannot change during a run, so it is computed once;
+    several steps (dependency checks, installs, service files) all
+    consult it.
+    """
     system = platform.system().lower()
     if system == "linux":
         # Determine Linux distribution
         try:
-            with open("/etc/os-release") as f:
-                os_release = {}
-                for line in f:
-                    if "=" in line:
-                        key, value = line.strip().split("=", 1)
-                        os_release[key] = value.strip('"')
-            
+            if hasattr(platform, "freedesktop_os_release"):
+                # Python 3.10+: parsed and cached by the stdlib
+                os_release = platform.freedesktop_os_release()
+            else:
+                with open("/etc/os-release") as f:
+                    os_release = {}
+                    for line in f:
+                        if "=" in line:
+                            key, value = line.strip().split("=", 1)
+                            os_release[key] = value.strip('"')
+
             if "ID" in os_release:
                 distro = os_release["ID"]
                 if distro in ["ubuntu", "debian", "linuxmint"]:
@@ -88,9 +99,7 @@ def get_platform_info():
 def check_dependencies(system, distro):
     """Check if required system dependencies are installed."""
     logger.info("Checking system dependencies...")
-    
-    missing_deps = []
-    
+
     if system not in SYSTEM_DEPENDENCIES:
         logger.warning(f"Unsupported system: {system}")
         return False, []
@@ -103,38 +112,10 @@ def check_dependencies(system, distro):
     if system == "linux":
         deps = SYSTEM_DEPENDENCIES[system][distro]
     
-    for dep in deps:
-        if system in ["linux", "darwin"]:
-            # Use which to check if the command is available
-            try:
-                result = subprocess.run(
-                    ["which", dep],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    check=False
-                )
-                if result.returncode != 0:
-                    missing_deps.append(dep)
-            except Exception as e:
-                logger.warning(f"Error checking dependency {dep}: {e}")
-                missing_deps.append(dep)
-        elif system == "win32":
-            # On Windows, check if the command is available in PATH
-            try:
-                result = subprocess.run(
-                    ["where", dep],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    check=False
-                )
-                if result.returncode != 0:
-                    missing_deps.append(dep)
-            except Exception as e:
-                logger.warning(f"Error checking dependency {dep}: {e}")
-                missing_deps.append(dep)
-    
+    # shutil.which walks PATH in-process (and handles PATHEXT on
+    # Windows), so no `which`/`where` subprocess is spawned per dep
+    missing_deps = [dep for dep in deps if shutil.which(dep) is None]
+
     return len(missing_deps) == 0, missing_deps
 
 def install_system_dependencies(system, distro, missing_deps):
@@ -180,15 +161,7 @@ def install_system_dependencies(system, distro, missing_deps):
         # On macOS, use Homebrew
         try:
             # Check if Homebrew is installed
-            brew_check = subprocess.run(
-                ["which", "brew"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                check=False
-            )
-            
-            if brew_check.returncode != 0:
+            if shutil.which("brew") is None:
                 logger.error("Homebrew is not installed. Please install it from https://brew.sh/")
                 return False
             
@@ -284,37 +257,22 @@ def setup_python_environment(install_dir):
     else:  # Unix-like
         pip_path = os.path.join(venv_dir, "bin", "pip")
     
-    # Upgrade pip
-    try:
-        subprocess.run(
-            [pip_path, "install", "--upgrade", "pip"],
-            check=True
-        )
-    except Exception as e:
-        logger.error(f"Error upgrading pip: {e}")
-        return False
-    
-    # Install dependencies
+    # One pip invocation covers the pip upgrade, the dependencies and
+    # the editable install of the server package, so the resolver runs
+    # once instead of three times. --prefer-binary avoids building
+    # wheels from sdists and --no-compile skips .pyc generation for
+    # packages that are run once at startup anyway.
     try:
         subprocess.run(
-            [pip_path, "install"] + PYTHON_DEPENDENCIES,
-            check=True
-        )
-    except Exception as e:
-        logger.error(f"Error installing Python dependencies: {e}")
-        return False
-    
-    # Install the MCP server package
-    try:
-        subprocess.run(
-            [pip_path, "install", "-e", "."],
+            [pip_path, "install", "--upgrade", "--prefer-binary", "--no-compile",
+             "pip"] + PYTHON_DEPENDENCIES + ["-e", "."],
             cwd=install_dir,
             check=True
         )
     except Exception as e:
-        logger.error(f"Error installing MCP server package: {e}")
+        logger.error(f"Error installing Python dependencies: {e}")
         return False
-    
+
     return True
 
 def configure_mcp_server(install_dir, port=5000, api_key=None):
@@ -349,8 +307,14 @@ def configure_mcp_server(install_dir, port=5000, api_key=None):
     
     config_path = os.path.join(config_dir, "config.json")
     try:
-        with open(config_path, "w") as f:
+        # Write to a temp sibling and rename so a crash mid-write never
+        # leaves a truncated config behind
+        tmp_path = config_path + ".tmp"
+        with open(tmp_path, "w") as f:
             json.dump(config, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, config_path)
         logger.info(f"Configuration saved to {config_path}")
         return True, api_key
     except Exception as e:
@@ -546,8 +510,13 @@ def main():
         # Save as a local MCP server
         local_mcp_file = os.path.join(config_dir, "local_mcp.json")
         try:
-            with open(local_mcp_file, "w") as f:
+            # Same atomic write-temp-then-rename as the main config
+            tmp_path = local_mcp_file + ".tmp"
+            with open(tmp_path, "w") as f:
                 json.dump(server_info, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, local_mcp_file)
             logger.info(f"Server information saved to {local_mcp_file}")
         except Exception as e:
             logger.error(f"Error saving server information: {e}")
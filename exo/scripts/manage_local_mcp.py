@@ -7,7 +7,6 @@ This script manages local MCP servers for the exo Multi-Agent Framework.
 
 import os
 import sys
-import json
 import time
 import signal
 import logging
@@ -17,6 +16,8 @@ import platform
 import requests
 from pathlib import Path
 
+from exo.utils import json_io
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -40,8 +41,10 @@ def load_server_info():
         return None
     
     try:
-        with open(LOCAL_MCP_FILE, "r") as f:
-            server_info = json.load(f)
+        # One bytes read plus json_io.loads beats a buffered text-mode
+        # json.load for these small files
+        with open(LOCAL_MCP_FILE, "rb") as f:
+            server_info = json_io.loads(f.read())
         return server_info
     except Exception as e:
         logger.error(f"Error loading server information: {e}")
@@ -0,0 +1,118 @@
+"""
+Tests for the configuration service caches and save semantics
+"""
+
+import json
+import os
+
+import pytest
+
+from exo.core import configuration
+from exo.core.configuration import ConfigurationService
+
+
+@pytest.fixture
+def config_env(tmp_path, monkeypatch):
+    """Point the configuration service at a temp dir with fresh caches."""
+    monkeypatch.setattr(configuration, "CONFIG_DIR", str(tmp_path))
+    monkeypatch.setattr(configuration, "CONFIG_FILE", str(tmp_path / "config.json"))
+    monkeypatch.setattr(configuration, "MCP_SERVERS_FILE", str(tmp_path / "mcp_servers.json"))
+    monkeypatch.setattr(configuration, "GENERAL_SETTINGS_FILE", str(tmp_path / "general_settings.json"))
+
+    # Reset the module-level caches so tests don't see each other's state
+    configuration._config_cache.update({"key": None, "data": None, "last_buf": None})
+    configuration._mcp_servers_cache.update({"key": None, "data": None, "by_id": None, "last_buf": None})
+    configuration._general_settings_cache.update({"key": None, "data": None, "last_buf": None})
+
+    return tmp_path
+
+
+class TestConfigCache:
+    """Tests for the stat-keyed parse cache."""
+
+    def test_unchanged_file_served_from_cache(self, config_env):
+        """A second load of an unchanged file returns the cached parse."""
+        first = ConfigurationService.load_config()
+        second = ConfigurationService.load_config()
+        assert second is first
+
+    def test_changed_file_is_reparsed(self, config_env):
+        """An external edit is picked up by the next load."""
+        ConfigurationService.load_config()
+
+        edited = dict(ConfigurationService.load_config())
+        edited["default_llm_provider"] = "edited-externally"
+        with open(configuration.CONFIG_FILE, "w") as f:
+            json.dump(edited, f)
+        # Force a distinct stat key even on coarse filesystems
+        os.utime(configuration.CONFIG_FILE, ns=(1, 1))
+
+        assert ConfigurationService.load_config()["default_llm_provider"] == "edited-externally"
+
+
+class TestSaveSemantics:
+    """Tests for no-op save skipping and atomic writes."""
+
+    def test_noop_save_skips_the_write(self, config_env):
+        """Saving identical content does not rewrite the file."""
+        config = ConfigurationService.load_config()
+        assert ConfigurationService.save_config(config)
+
+        before = os.stat(configuration.CONFIG_FILE).st_mtime_ns
+        assert ConfigurationService.save_config(config)
+        assert os.stat(configuration.CONFIG_FILE).st_mtime_ns == before
+
+    def test_save_after_external_edit_writes(self, config_env):
+        """An external edit must not be masked by the no-op skip."""
+        config = dict(ConfigurationService.load_config())
+        assert ConfigurationService.save_config(config)
+
+        edited = dict(config)
+        edited["default_llm_provider"] = "edited-externally"
+        with open(configuration.CONFIG_FILE, "w") as f:
+            json.dump(edited, f)
+        os.utime(configuration.CONFIG_FILE, ns=(1, 1))
+
+        # Reading the edit, then saving the original payload again,
+        # must actually write it back to disk
+        assert ConfigurationService.load_config()["default_llm_provider"] == "edited-externally"
+        assert ConfigurationService.save_config(config)
+
+        with open(configuration.CONFIG_FILE) as f:
+            on_disk = json.load(f)
+        assert on_disk["default_llm_provider"] == config["default_llm_provider"]
+        assert ConfigurationService.load_config()["default_llm_provider"] == config["default_llm_provider"]
+
+    def test_save_leaves_no_temp_files(self, config_env):
+        """The atomic write cleans up its temp sibling."""
+        ConfigurationService.save_config(ConfigurationService.load_config())
+        leftovers = [name for name in os.listdir(config_env) if ".tmp" in name]
+        assert leftovers == []
+
+
+class TestMCPServers:
+    """Tests for the MCP server list cache and index."""
+
+    def test_round_trip_and_lookup(self, config_env):
+        """Saved servers come back and get_mcp_server finds them by id."""
+        servers = ConfigurationService.load_mcp_servers()
+        servers.append({"id": "extra", "name": "Extra", "url": "http://localhost:9999", "local": True})
+        assert ConfigurationService.save_mcp_servers(servers)
+
+        found = ConfigurationService.get_mcp_server("extra")
+        assert found is not None
+        assert found["url"] == "http://localhost:9999"
+        assert ConfigurationService.get_mcp_server("missing") is None
+
+    def test_save_after_external_edit_writes(self, config_env):
+        """The server list no-op skip also resets on external edits."""
+        servers = ConfigurationService.load_mcp_servers()
+        assert ConfigurationService.save_mcp_servers(servers)
+
+        with open(configuration.MCP_SERVERS_FILE, "w") as f:
+            json.dump(servers + [{"id": "rogue", "name": "Rogue", "url": "http://localhost:1"}], f)
+        os.utime(configuration.MCP_SERVERS_FILE, ns=(1, 1))
+
+        assert ConfigurationService.get_mcp_server("rogue") is not None
+        assert ConfigurationService.save_mcp_servers(servers)
+        assert ConfigurationService.get_mcp_server("rogue") is None
@@ -0,0 +1,127 @@
+"""
+Tests for the filesystem MCP server endpoints
+"""
+
+import json
+import os
+
+import pytest
+
+from exo.mcp import filesystem
+
+
+@pytest.fixture
+def client():
+    """Flask test client with a fresh stat cache."""
+    filesystem._stat_cache.clear()
+    return filesystem.app.test_client()
+
+
+class TestReadWrite:
+    """Tests for /write and /read."""
+
+    def test_json_round_trip(self, client, tmp_path):
+        """Content written through /write comes back from /read."""
+        path = str(tmp_path / "note.txt")
+        response = client.post("/write", json={"path": path, "content": "hello"})
+        assert response.status_code == 200
+        assert response.get_json()["success"] is True
+
+        response = client.post("/read", json={"path": path})
+        assert response.status_code == 200
+        assert response.get_json()["content"] == "hello"
+
+    def test_streamed_read_is_valid_json(self, client, tmp_path, monkeypatch):
+        """Files over the small-file limit stream back as valid JSON."""
+        monkeypatch.setattr(filesystem, "_SMALL_FILE_LIMIT", 8)
+        path = str(tmp_path / "big.txt")
+        content = 'line with "quotes" and \\ backslashes\n' * 50
+        client.post("/write", json={"path": path, "content": content})
+
+        response = client.post("/read", json={"path": path})
+        assert response.status_code == 200
+        assert json.loads(response.get_data(as_text=True))["content"] == content
+
+    def test_raw_read_returns_exact_bytes(self, client, tmp_path):
+        """?raw=1 serves the file body untouched."""
+        path = str(tmp_path / "blob.bin")
+        body = os.urandom(2048)
+        with open(path, "wb") as f:
+            f.write(body)
+
+        response = client.post("/read?raw=1", json={"path": path})
+        assert response.status_code == 200
+        assert response.data == body
+
+    def test_octet_stream_write(self, client, tmp_path):
+        """A binary body streams to the path from the query string."""
+        path = str(tmp_path / "upload.bin")
+        body = os.urandom(4096)
+        response = client.post(
+            f"/write?path={path}", data=body, content_type="application/octet-stream"
+        )
+        assert response.status_code == 200
+        with open(path, "rb") as f:
+            assert f.read() == body
+
+    def test_write_invalidates_stat_cache(self, client, tmp_path):
+        """A read after a write sees the new content immediately."""
+        path = str(tmp_path / "cached.txt")
+        client.post("/write", json={"path": path, "content": "first"})
+        client.post("/read", json={"path": path})
+        client.post("/write", json={"path": path, "content": "second"})
+
+        response = client.post("/read", json={"path": path})
+        assert response.get_json()["content"] == "second"
+
+    def test_read_missing_file(self, client, tmp_path):
+        """Reading a nonexistent path returns 404."""
+        response = client.post("/read", json={"path": str(tmp_path / "missing.txt")})
+        assert response.status_code == 404
+
+
+class TestListDelete:
+    """Tests for /list and /delete."""
+
+    def test_list_directory(self, client, tmp_path):
+        """Listing returns name, type and size per entry."""
+        (tmp_path / "a.txt").write_text("abc")
+        (tmp_path / "sub").mkdir()
+
+        response = client.post("/list", json={"path": str(tmp_path)})
+        assert response.status_code == 200
+        items = {item["name"]: item for item in response.get_json()["items"]}
+        assert items["a.txt"]["type"] == "file"
+        assert items["a.txt"]["size"] == 3
+        assert items["sub"]["type"] == "directory"
+
+    def test_delete_file(self, client, tmp_path):
+        """Deleting a file removes it and a re-read returns 404."""
+        path = str(tmp_path / "gone.txt")
+        client.post("/write", json={"path": path, "content": "x"})
+
+        response = client.post("/delete", json={"path": path})
+        assert response.status_code == 200
+        assert not os.path.exists(path)
+        assert client.post("/read", json={"path": path}).status_code == 404
+
+
+class TestJSONGuard:
+    """Tests for the shared JSON body guard."""
+
+    def test_malformed_body_is_rejected(self, client):
+        """Bodies that are not JSON objects return 400, not 500."""
+        response = client.post("/read", data="not json", content_type="application/json")
+        assert response.status_code == 400
+        response = client.post("/list", data="[1, 2]", content_type="application/json")
+        assert response.status_code == 400
+
+    def test_oversized_body_is_rejected(self, client):
+        """A declared length over the cap is refused before decoding."""
+        response = client.post(
+            "/read",
+            data="{}",
+            content_type="application/json",
+            headers={"Content-Length": str(filesystem._MAX_JSON_BODY + 1)},
+        )
+        assert response.status_code == 400
@@ -5,6 +5,7 @@ This module provides a native desktop UI using Electron.
 """
 
 import os
+import shutil
 import sys
 import subprocess
 import threading
@@ -15,6 +16,10 @@ from typing import Optional, Dict, Any, List
 
 logger = logging.getLogger(__name__)
 
+# Electron UI directory, computed once at import; shared by __init__
+# and the instance-free availability probe
+_ELECTRON_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "electron")
+
 class ElectronUI:
     """
     Electron UI for the exo Multi-Agent Framework.
@@ -39,7 +44,7 @@ class ElectronUI:
         self.is_running = False
         
         # Get the path to the Electron UI directory
-        self.electron_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "electron")
+        self.electron_dir = _ELECTRON_DIR
         
         # Check if the Electron UI directory exists
         if not os.path.exists(self.electron_dir):
@@ -134,10 +139,14 @@ class ElectronUI:
         except Exception as e:
             logger.error(f"Error launching Electron app: {e}")
     
-    def is_available(self) -> bool:
+    @staticmethod
+    def is_available() -> bool:
         """
         Check if the Electron UI is available.
-        
+
+        A static probe: callers can decide whether to construct the UI
+        at all without allocating an instance first.
+
         Returns:
             True if the Electron UI is available, False otherwise
         """
@@ -145,21 +154,14 @@ class ElectronUI:
         in_container = os.path.exists('/.dockerenv') or os.environ.get('CONTAINER_ENV')
         if in_container:
             return False
-        
+
         # Check if the Electron UI directory exists
-        if not os.path.exists(self.electron_dir):
+        if not os.path.exists(_ELECTRON_DIR):
             return False
-        
-        # Check if Node.js is installed
-        try:
-            subprocess.run(["node", "--version"], stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return False
-        
-        # Check if npm is installed
-        try:
-            subprocess.run(["npm", "--version"], stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
-        except (subprocess.CalledProcessError, FileNotFoundError):
+
+        # Check that Node.js and npm are on PATH; shutil.which scans
+        # PATH without spawning a process per probe
+        if shutil.which("node") is None or shutil.which("npm") is None:
             return False
-        
+
         return True
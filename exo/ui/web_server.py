@@ -417,19 +417,22 @@ class WebServer:
             self.websocket_connections.remove(websocket)
             logger.info(f"WebSocket client disconnected: {websocket.remote_address}")
 
-    async def _broadcast_message(self, message: Dict):
+    async def _broadcast_message(self, message: Dict, message_json: str = None):
         """
         Broadcast a message to all WebSocket clients.
 
         Args:
             message: The message to broadcast
+            message_json: Pre-serialized JSON form of the message, if
+                the caller already has it
         """
         if not self.websocket_connections:
             logger.warning("No WebSocket connections, cannot broadcast message")
             return
 
-        # Convert the message to JSON
-        message_json = json.dumps(message)
+        # Convert the message to JSON unless the caller pre-encoded it
+        if message_json is None:
+            message_json = json.dumps(message)
 
         # Send the message to all clients
         websockets_to_remove = set()
@@ -505,6 +508,28 @@ class WebServer:
             "data": message
         })
 
+    def send_message_serialized(self, message: Dict, message_json: str):
+        """
+        Send a message whose JSON form the caller pre-encoded.
+
+        The WebSocket broadcast reuses message_json instead of running
+        json.dumps again; SocketIO still receives the dict.
+
+        Args:
+            message: The message to send
+            message_json: JSON serialization of the same message
+        """
+        logger.info(f"Sending message to clients: {message}")
+
+        # Send the message to SocketIO clients
+        self.socketio.emit("message", message)
+
+        # Send the pre-encoded message to WebSocket clients
+        asyncio.run_coroutine_threadsafe(
+            self._broadcast_message(message, message_json),
+            asyncio.get_event_loop()
+        )
+
     def handle_voice_message(self, message_data: Dict):
         """
         Handle a voice message from the UI.
@@ -0,0 +1,32 @@
+"""
+JSON serialisation helpers for exo.
+
+This module wraps orjson when it is installed (2-5x faster than the
+standard library for the small config files exo reads and writes) and
+falls back to stdlib json otherwise, so orjson stays an optional
+dependency.
+"""
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+import json
+
+
+def loads(data):
+    """Parse JSON from a str or bytes object."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    if isinstance(data, bytes):
+        data = data.decode("utf-8")
+    return json.loads(data)
+
+
+def dumps(data):
+    """Serialise data to indented JSON bytes, suitable for binary writes."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
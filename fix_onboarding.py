@@ -5,11 +5,12 @@ Fix script for the onboarding process
 
 import os
 import sys
-import json
 import logging
 import shutil
 from pathlib import Path
 
+from exo.utils import json_io
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -58,16 +59,26 @@ def main():
         "DEFAULT_LLM_MODEL": "gpt-3.5-turbo"
     }
 
-    # Write the config file
-    with open(config_file, "w") as f:
-        json.dump(config, f, indent=2)
+    # Write the config file (json_io serialises to bytes in one shot,
+    # using orjson when available); temp-then-rename keeps the write
+    # atomic
+    tmp_file = config_file + ".tmp"
+    with open(tmp_file, "wb") as f:
+        f.write(json_io.dumps(config))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, config_file)
 
     # Create an empty MCP servers file
     mcp_servers = {}
 
     # Write the MCP servers file
-    with open(mcp_servers_file, "w") as f:
-        json.dump(mcp_servers, f, indent=2)
+    tmp_file = mcp_servers_file + ".tmp"
+    with open(tmp_file, "wb") as f:
+        f.write(json_io.dumps(mcp_servers))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, mcp_servers_file)
 
     logger.info("Onboarding process fixed")
     logger.info("You can now run the onboarding process with:")